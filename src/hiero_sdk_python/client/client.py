@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 import os
+import threading
 import warnings
 from decimal import Decimal
 from typing import Literal, NamedTuple
@@ -68,6 +69,9 @@ class Client:
 
         self.logger: Logger = Logger(LogLevel.from_env(), "hiero_sdk_python")
 
+        # Set on close() to wake executions waiting out a retry backoff
+        self._shutdown_event: threading.Event = threading.Event()
+
     @property
     def mirror_stub(self) -> mirror_consensus_grpc.ConsensusServiceStub:
         return self.network.get_mirror_stub()
@@ -218,7 +222,12 @@ class Client:
         """
         Closes any open gRPC channels and frees resources.
         Call this when you are done using the Client to ensure a clean shutdown.
+
+        Executions waiting out a retry backoff stop immediately instead of retrying.
         """
+        self._shutdown_event.set()
+        # Executions started after close() get a fresh event, so the client stays reusable
+        self._shutdown_event = threading.Event()
         self.network._close()
 
     def set_transport_security(self, enabled: bool) -> Client:
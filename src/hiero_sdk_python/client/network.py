@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import secrets
+import threading
 import time
 from typing import Any
 
@@ -113,6 +114,12 @@ class Network:
 
         self.nodes: list[_Node] = []
         self._healthy_nodes: list[_Node] = []
+        # Guards _healthy_nodes and the round-robin index, which executions on other threads update
+        self._health_lock = threading.Lock()
+
+        # Index of self.nodes by account ID, built whenever the node list is replaced
+        self._nodes_by_account_id: dict[AccountId, _Node] = {}
+        self._indexed_nodes: list[_Node] | None = None
 
         self._set_network_nodes(nodes)
 
@@ -156,12 +163,11 @@ class Network:
             node._set_root_certificates(self._root_certificates)  # pylint: disable=protected-access
 
         self.nodes = final_nodes
-        self._healthy_nodes = []
+        self._index_nodes(final_nodes)
+        healthy_nodes = [node for node in self.nodes if node.is_healthy()]
 
-        for node in self.nodes:
-            if not node.is_healthy():
-                continue
-            self._healthy_nodes.append(node)
+        with self._health_lock:
+            self._healthy_nodes = healthy_nodes
 
     def _resolve_nodes(self, nodes: list[_Node] | None) -> list[_Node]:
         if nodes:
@@ -231,14 +237,15 @@ class Network:
         """
         self._readmit_nodes()
 
-        if not self._healthy_nodes:
-            raise ValueError("No healthy node available to select")
+        with self._health_lock:
+            if not self._healthy_nodes:
+                raise ValueError("No healthy node available to select")
 
-        self._node_index %= len(self._healthy_nodes)
-        self._node_index = (self._node_index + 1) % len(self._healthy_nodes)
+            self._node_index %= len(self._healthy_nodes)
+            self._node_index = (self._node_index + 1) % len(self._healthy_nodes)
 
-        self.current_node = self._healthy_nodes[self._node_index]
-        return self.current_node
+            self.current_node = self._healthy_nodes[self._node_index]
+            return self.current_node
 
     def _get_node(self, account_id: AccountId) -> _Node | None:
         """
@@ -251,10 +258,18 @@ class Network:
             _Node | None: The matching node, or None if not found.
         """
         self._readmit_nodes()
-        for node in self.nodes:
-            if node._account_id == account_id:
-                return node
-        return None
+        # The index is built by _set_network_nodes; this covers a node list assigned directly
+        if self.nodes is not self._indexed_nodes:
+            self._index_nodes(self.nodes)
+        return self._nodes_by_account_id.get(account_id)
+
+    def _index_nodes(self, nodes: list[_Node]) -> None:
+        """Rebuild the account ID index of the given nodes, keeping the first node for each ID."""
+        index: dict[AccountId, _Node] = {}
+        for node in nodes:
+            index.setdefault(node._account_id, node)
+        self._nodes_by_account_id = index
+        self._indexed_nodes = nodes
 
     def get_mirror_address(self) -> str:
         """
@@ -419,15 +434,17 @@ class Network:
         if not isinstance(node, _Node):
             raise TypeError("node must be of type _Node")
 
-        if node in self._healthy_nodes:
-            self._healthy_nodes.remove(node)
+        with self._health_lock:
+            if node in self._healthy_nodes:
+                self._healthy_nodes.remove(node)
 
     def _mark_node_healthy(self, node: _Node) -> None:
         if not isinstance(node, _Node):
             raise TypeError("node must be of type _Node")
 
-        if node not in self._healthy_nodes:
-            self._healthy_nodes.append(node)
+        with self._health_lock:
+            if node not in self._healthy_nodes:
+                self._healthy_nodes.append(node)
 
     def _close_mirror_node(self):
         """Safely closes the mirror gRPC channel."""
@@ -5,16 +5,13 @@ on the Hedera network using the Hiero SDK.
 
 from __future__ import annotations
 
-from google.protobuf import wrappers_pb2 as _wrappers_pb2
-
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.consensus.topic_id import TopicId
 from hiero_sdk_python.crypto.key import Key
 from hiero_sdk_python.Duration import Duration
 from hiero_sdk_python.executable import _Method
-from hiero_sdk_python.hapi.services import consensus_update_topic_pb2, duration_pb2, timestamp_pb2, transaction_pb2
-from hiero_sdk_python.hapi.services.custom_fees_pb2 import FeeExemptKeyList, FixedCustomFeeList
+from hiero_sdk_python.hapi.services import consensus_update_topic_pb2, timestamp_pb2, transaction_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
     SchedulableTransactionBody,
 )
@@ -250,32 +247,33 @@ class TopicUpdateTransaction(Transaction):
         if self.topic_id is None:
             raise ValueError("Missing required fields: topic_id")
 
-        custom_fees = (
-            FixedCustomFeeList(fees=[custom_fee._to_topic_fee_proto() for custom_fee in self.custom_fees])
-            if self.custom_fees is not None
-            else None
-        )
-
-        fee_exempt_key_list = (
-            FeeExemptKeyList(keys=[key_to_proto(key) for key in self.fee_exempt_keys])
-            if self.fee_exempt_keys is not None
-            else None
-        )
-
-        return consensus_update_topic_pb2.ConsensusUpdateTopicTransactionBody(
-            topicID=self.topic_id._to_proto(),
-            adminKey=key_to_proto(self.admin_key) if self.admin_key else None,
-            submitKey=key_to_proto(self.submit_key) if self.submit_key else None,
-            autoRenewPeriod=(
-                duration_pb2.Duration(seconds=self.auto_renew_period.seconds) if self.auto_renew_period else None
-            ),
-            autoRenewAccount=(self.auto_renew_account._to_proto() if self.auto_renew_account else None),
-            expirationTime=self.expiration_time._to_protobuf() if self.expiration_time else None,
-            memo=_wrappers_pb2.StringValue(value=self.memo) if self.memo is not None else None,
-            custom_fees=custom_fees,
-            fee_schedule_key=key_to_proto(self.fee_schedule_key) if self.fee_schedule_key else None,
-            fee_exempt_key_list=fee_exempt_key_list,
-        )
+        # Only the fields being updated are set, so everything else stays absent from the message
+        body = consensus_update_topic_pb2.ConsensusUpdateTopicTransactionBody(topicID=self.topic_id._to_proto())
+        if self.admin_key:
+            body.adminKey.CopyFrom(key_to_proto(self.admin_key))
+        if self.submit_key:
+            body.submitKey.CopyFrom(key_to_proto(self.submit_key))
+        if self.auto_renew_period:
+            body.autoRenewPeriod.seconds = self.auto_renew_period.seconds
+        if self.auto_renew_account:
+            body.autoRenewAccount.CopyFrom(self.auto_renew_account._to_proto())
+        if self.expiration_time:
+            body.expirationTime.CopyFrom(self.expiration_time._to_protobuf())
+        # An empty memo is still sent, since it is how an existing memo is cleared
+        if self.memo is not None:
+            body.memo.value = self.memo
+            body.memo.SetInParent()
+        # An empty list is still sent, since it is how existing fees or exempt keys are cleared
+        if self.custom_fees is not None:
+            body.custom_fees.SetInParent()
+            body.custom_fees.fees.extend(custom_fee._to_topic_fee_proto() for custom_fee in self.custom_fees)
+        if self.fee_schedule_key:
+            body.fee_schedule_key.CopyFrom(key_to_proto(self.fee_schedule_key))
+        if self.fee_exempt_keys is not None:
+            body.fee_exempt_key_list.SetInParent()
+            body.fee_exempt_key_list.keys.extend(key_to_proto(key) for key in self.fee_exempt_keys)
+
+        return body
 
     def build_transaction_body(self) -> transaction_pb2.TransactionBody:
         """
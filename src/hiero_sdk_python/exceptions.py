@@ -7,6 +7,7 @@ from hiero_sdk_python.response_code import ResponseCode
 
 if TYPE_CHECKING:
     from hiero_sdk_python import TransactionId, TransactionReceipt
+    from hiero_sdk_python.account.account_id import AccountId
 
 
 class PrecheckError(Exception):
@@ -53,13 +54,23 @@ class MaxAttemptsError(Exception):
 
     Attributes:
         message (str): The error message explaining why the maximum attempts were reached
-        node_id (str): The ID of the node that was being contacted when the max attempts were reached
+        node_id (AccountId | str): The ID of the node that was being contacted when the max attempts were reached
         last_error (BaseException): The last error that occurred during the final attempt
+        attempts (int): The number of attempts made before giving up, if known
+        last_status (ResponseCode): The status carried by the last error, if it was a precheck or receipt error
     """
 
-    def __init__(self, message: str, node_id: str, last_error: BaseException | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        node_id: AccountId | str | None,
+        last_error: BaseException | None = None,
+        attempts: int | None = None,
+    ) -> None:
         self.node_id = node_id
         self.last_error = last_error
+        self.attempts = attempts
+        self.last_status = last_error.status if isinstance(last_error, (PrecheckError, ReceiptStatusError)) else None
 
         # Build a comprehensive error message
         error_message = message
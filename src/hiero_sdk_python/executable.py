@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import math
+import random
 import re
+import threading
 import time
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from enum import IntEnum
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import grpc
@@ -25,6 +29,12 @@ if TYPE_CHECKING:
 
 RST_STREAM = re.compile(r"\brst[^0-9a-zA-Z]stream\b", re.IGNORECASE | re.DOTALL)
 
+# Source of randomness for retry jitter, kept at module level so tests can replace it
+_BACKOFF_RNG = random.SystemRandom()
+
+# Default cap on the worker threads of one batch, the same cap ThreadPoolExecutor uses
+_MAX_BATCH_WORKERS = 32
+
 
 class _Method:
     """
@@ -36,6 +46,8 @@ class _Method:
     via the _get_method() function.
     """
 
+    __slots__ = ("query", "transaction", "_invoke")
+
     def __init__(
         self,
         query_func: Callable[..., Any] | None = None,
@@ -50,14 +62,23 @@ class _Method:
         """
         self.query = query_func
         self.transaction = transaction_func
+        # A method is either a transaction or a query for its whole lifetime, so the callable
+        # to invoke is chosen once here instead of on every call
+        if transaction_func is not None:
+            self._invoke = transaction_func
+        elif query_func is not None:
+            self._invoke = query_func
+        else:
+            self._invoke = _raise_no_method
 
 
-class _ExecutionState(IntEnum):
+class _ExecutionState:
     """
-    Enum representing the possible states of transaction execution.
+    Constants representing the possible states of transaction execution.
 
     These states are used to determine how to handle the response
-    from a transaction execution attempt.
+    from a transaction execution attempt. They are plain ints rather than
+    an enum, as _should_retry() returns one on every attempt.
     """
 
     RETRY = 0  # The transaction should be retried
@@ -65,6 +86,9 @@ class _ExecutionState(IntEnum):
     ERROR = 2  # The transaction failed with an error
     EXPIRED = 3  # The transaction expired before being processed
 
+    # Names for logging, indexed by state
+    NAMES = ("RETRY", "FINISHED", "ERROR", "EXPIRED")
+
 
 class _Executable(ABC):
     """
@@ -85,6 +109,8 @@ class _Executable(ABC):
         self._min_backoff: float | None = None
         self._grpc_deadline: float | None = None
         self._request_timeout: float | None = None
+        # Backoff per attempt, precomputed once the backoff configuration is resolved
+        self._backoff_schedule: tuple[float, ...] = ()
 
         self.node_account_id: AccountId | None = None
         self.node_account_ids: list[AccountId] = []
@@ -92,6 +118,21 @@ class _Executable(ABC):
         self._used_node_account_id: AccountId | None = None
         self._node_account_ids_index: int = 0
 
+    @property
+    def grpc_deadline(self) -> float | None:
+        """The gRPC call deadline (per attempt) in seconds, or None until set or resolved from the client."""
+        return self._grpc_deadline
+
+    @property
+    def min_backoff(self) -> float | None:
+        """The minimum backoff delay between retries in seconds, or None until set or resolved from the client."""
+        return self._min_backoff
+
+    @property
+    def max_backoff(self) -> float | None:
+        """The maximum backoff delay between retries in seconds, or None until set or resolved from the client."""
+        return self._max_backoff
+
     def set_node_account_ids(self, node_account_ids: list[AccountId]):
         """
         Explicitly set the node account IDs to execute against.
@@ -135,6 +176,7 @@ class _Executable(ABC):
             raise ValueError("max_attempts must be greater than 0")
 
         self._max_attempts = max_attempts
+        self._backoff_schedule = ()
         return self
 
     def set_grpc_deadline(self, grpc_deadline: int | float):
@@ -214,6 +256,7 @@ class _Executable(ABC):
             raise ValueError("min_backoff cannot exceed max_backoff")
 
         self._min_backoff = float(min_backoff)
+        self._backoff_schedule = ()
         return self
 
     def set_max_backoff(self, max_backoff: int | float):
@@ -237,6 +280,7 @@ class _Executable(ABC):
             raise ValueError("max_backoff cannot be less than min_backoff")
 
         self._max_backoff = float(max_backoff)
+        self._backoff_schedule = ()
         return self
 
     def _select_node_account_id(self) -> AccountId | None:
@@ -259,7 +303,7 @@ class _Executable(ABC):
             self._node_account_ids_index += 1
 
     @abstractmethod
-    def _should_retry(self, response) -> _ExecutionState:
+    def _should_retry(self, response) -> int:
         """
         Determine whether the operation should be retried based on the response.
 
@@ -267,7 +311,7 @@ class _Executable(ABC):
             response: The response from the network
 
         Returns:
-            _ExecutionState: The execution state indicating what to do next
+            int: The _ExecutionState value indicating what to do next
         """
         raise NotImplementedError("_should_retry must be implemented by subclasses")
 
@@ -322,6 +366,19 @@ class _Executable(ABC):
         """
         raise NotImplementedError("_map_response must be implemented by subclasses")
 
+    def execute(self, client: Client, timeout: int | float | None = None):
+        """
+        Execute the transaction or query against the network.
+
+        Args:
+            client (Client): The client to execute with
+            timeout (int | float | None): The total execution timeout in seconds
+
+        Returns:
+            The response for the operation
+        """
+        raise NotImplementedError("execute must be implemented by subclasses")
+
     def _get_request_id(self):
         """Format the request ID for the logger."""
         return f"{self.__class__.__name__}:{time.time_ns()}"
@@ -346,6 +403,8 @@ class _Executable(ABC):
             if getattr(self, attr) is None:
                 setattr(self, attr, default)
 
+        self._backoff_schedule = self._build_backoff_schedule()
+
         # nodes to which the executaion must be run against, if not provided used nodes from client
         if not self.node_account_ids:
             self.node_account_ids = [node._account_id for node in client.network._healthy_nodes]
@@ -367,20 +426,37 @@ class _Executable(ABC):
 
         return True
 
+    def _build_backoff_schedule(self) -> tuple[float, ...]:
+        """Precompute the backoff for every attempt, doubling from min_backoff and capped at max_backoff."""
+        return _backoff_schedule(self._min_backoff, self._max_backoff, self._max_attempts)
+
     def _calculate_backoff(self, attempt: int):
         """Calculate backoff for the given attempt, attempt start from 0."""
-        return min(self._max_backoff, self._min_backoff * (2 ** (attempt + 1)))
+        # Before the config is resolved, build just enough of the schedule for this attempt
+        schedule = self._backoff_schedule or _backoff_schedule(self._min_backoff, self._max_backoff, attempt + 1)
+        # Attempts past the end of the schedule keep its last backoff
+        return schedule[min(attempt, len(schedule) - 1)]
+
+    def _calculate_jittered_backoff(self, attempt: int) -> float:
+        """
+        Calculate a "full jitter" backoff for the given attempt, attempt start from 0.
 
-    def _handle_unhealthy_node(self, proto_request, attempt, logger, err) -> bool:
+        The delay is drawn uniformly between min_backoff and the exponential backoff
+        for the attempt, so clients retrying against the same node do not retry in lockstep.
+        """
+        return _BACKOFF_RNG.uniform(self._min_backoff, self._calculate_backoff(attempt))
+
+    def _handle_unhealthy_node(self, proto_request, attempt, logger, err, request_id, cancel_event) -> bool:
         """Handle node switching and backoff for unhealthy node."""
         # Check if the request is a transaction receipt or record because they are single node requests
         if _is_transaction_receipt_or_record_request(proto_request):
             _delay_for_attempt(
-                self._get_request_id(),
+                request_id,
                 self._min_backoff,
                 attempt,
                 logger,
                 err,
+                cancel_event,
             )
             return True
 
@@ -409,7 +485,8 @@ class _Executable(ABC):
 
         Raises:
             PrecheckError: If the operation fails with a non-retryable error
-            MaxAttemptsError: If the operation fails after the maximum number of attempts
+            MaxAttemptsError: If the operation fails after the maximum number of attempts,
+                or is cancelled because the client was closed
             ReceiptStatusError: If the operation fails with a receipt status error
         """
         self._resolve_execution_config(client, timeout)
@@ -418,15 +495,30 @@ class _Executable(ABC):
         tx_id = getattr(self, "transaction_id", None)
 
         logger = client.logger
+        network = client.network
+        # Captured once, so closing the client cancels this execution even if it is reused afterwards
+        shutdown_event = client._shutdown_event
+        # Bound once; the configuration does not change while executing
+        request_id = self._get_request_id()
+        max_attempts = self._max_attempts
+        grpc_deadline = self._grpc_deadline
+        request_timeout = self._request_timeout
         start = time.monotonic()
 
-        for attempt in range(self._max_attempts):
-            if time.monotonic() - start >= self._request_timeout:
+        # The method and request only depend on the node (and its channel), so they are
+        # prepared once per node and reused whenever the node is selected again
+        prepared_requests: dict[AccountId, tuple[_Channel, _Method, Any]] = {}
+
+        attempts = 0
+        for attempt in range(max_attempts):
+            remaining = request_timeout - (time.monotonic() - start)
+            if remaining <= 0 or shutdown_event.is_set():
                 break
+            attempts = attempt + 1
 
             # Select node
             node_id = self._select_node_account_id()
-            node = client.network._get_node(node_id)
+            node = network._get_node(node_id)
 
             if node is None:
                 raise RuntimeError(f"No node found for node_account_id: {self.node_account_id}")
@@ -434,46 +526,46 @@ class _Executable(ABC):
             # Store for logging and receipts
             self.node_account_id = node._account_id
 
-            # Create a channel wrapper from the client's channel
-            channel = node._get_channel()
-
             logger.trace(
                 "Executing",
                 "requestId",
-                self._get_request_id(),
+                request_id,
                 "nodeAccountID",
                 self.node_account_id,
                 "attempt",
                 attempt + 1,
                 "maxAttempts",
-                self._max_attempts,
+                max_attempts,
             )
 
-            # Get the appropriate gRPC method to call
-            method = self._get_method(channel)
-
-            # Build the request using the executable's _make_request method
-            proto_request = self._make_request()
+            channel = node._get_channel()
+            prepared = prepared_requests.get(node_id)
+            if prepared is None or prepared[0] is not channel:
+                # Get the appropriate gRPC method to call and build the request for this node
+                prepared = (channel, self._get_method(channel), self._make_request())
+                prepared_requests[node_id] = prepared
+            _, method, proto_request = prepared
 
             if not node.is_healthy():
-                self._handle_unhealthy_node(proto_request, attempt, logger, err_persistant)
+                self._handle_unhealthy_node(proto_request, attempt, logger, err_persistant, request_id, shutdown_event)
                 continue
 
             # Execute the GRPC call
             try:
-                logger.trace("Executing gRPC call", "requestId", self._get_request_id())
-                response = _execute_method(method, proto_request, self._grpc_deadline)
+                logger.trace("Executing gRPC call", "requestId", request_id)
+                # Never let a single attempt outlive the overall request timeout
+                response = _execute_method(method, proto_request, min(grpc_deadline, remaining))
 
             except Exception as e:
                 if not self._should_retry_exponentially(e):
                     raise e
 
-                client.network._increase_backoff(node)
+                network._increase_backoff(node)
                 err_persistant = e
                 self._advance_node_index()
                 continue
 
-            client.network._decrease_backoff(node)
+            network._decrease_backoff(node)
 
             # Map the response to an error
             status_error = self._map_status_error(response)
@@ -485,45 +577,59 @@ class _Executable(ABC):
                 "nodeAccountID",
                 self.node_account_id,
                 "network",
-                client.network.network,
+                network.network,
                 "state",
-                execution_state.name,
+                _ExecutionState.NAMES[execution_state],
                 "txID",
                 tx_id,
             )
 
-            # Handle the execution state
-            match execution_state:
-                case _ExecutionState.RETRY:
-                    if status_error.status == ResponseCode.INVALID_NODE_ACCOUNT:
-                        client.network._increase_backoff(node)
-                        # update nodes from the mirror_node
-                        client.update_network()
-
-                    # If we should retry, wait for the backoff period and try again
-                    err_persistant = status_error
-                    _delay_for_attempt(
-                        self._get_request_id(),
-                        self._calculate_backoff(attempt),
-                        attempt,
-                        logger,
-                        err_persistant,
-                    )
-                    self._advance_node_index()
-                    continue
-                case _ExecutionState.EXPIRED:
-                    raise status_error
-                case _ExecutionState.ERROR:
-                    raise status_error
-                case _ExecutionState.FINISHED:
-                    # If the transaction completed successfully, map the response and return it
-                    logger.trace(f"{self.__class__.__name__} finished execution")
-                    return self._map_response(response, self.node_account_id, proto_request)
+            # Handle the execution state, checking the most frequent outcome first
+            if execution_state == _ExecutionState.FINISHED:
+                # If the transaction completed successfully, map the response and return it
+                logger.trace(f"{self.__class__.__name__} finished execution")
+                return self._map_response(response, self.node_account_id, proto_request)
+
+            if execution_state in (_ExecutionState.ERROR, _ExecutionState.EXPIRED):
+                raise status_error
+
+            if execution_state == _ExecutionState.RETRY:
+                if status_error.status == ResponseCode.INVALID_NODE_ACCOUNT:
+                    network._increase_backoff(node)
+                    # update nodes from the mirror_node
+                    client.update_network()
+
+                # If we should retry, wait for the backoff period and try again
+                err_persistant = status_error
+                _delay_for_attempt(
+                    request_id,
+                    self._calculate_jittered_backoff(attempt),
+                    attempt,
+                    logger,
+                    err_persistant,
+                    shutdown_event,
+                )
+                self._advance_node_index()
+
+        if shutdown_event.is_set():
+            logger.error(
+                "Request cancelled because the client was closed",
+                "requestId",
+                request_id,
+                "last exception being",
+                err_persistant,
+            )
+            raise MaxAttemptsError(
+                "Execution cancelled because the client was closed",
+                self.node_account_id,
+                err_persistant,
+                attempts=attempts,
+            )
 
         logger.error(
             "Exceeded maximum attempts for request",
             "requestId",
-            self._get_request_id(),
+            request_id,
             "last exception being",
             err_persistant,
         )
@@ -531,8 +637,121 @@ class _Executable(ABC):
             "Exceeded maximum attempts or request timeout",
             self.node_account_id,
             err_persistant,
+            attempts=attempts,
         )
 
+    async def _execute_async(self, client: Client, timeout: int | float | None = None):
+        """
+        Execute a transaction or query with retry logic without blocking the event loop.
+
+        Runs the public execute() on a worker thread, so transactions are still frozen and
+        signed by the operator and queries prepared and paid for, while the blocking gRPC
+        calls and any backoff between attempts stay off the event loop. Many executions can
+        then be awaited concurrently from a single event loop.
+
+        Executions gathered this way run on separate threads. They may share one client, as
+        in _execute_batch, whose node channels and node health are updated under locks. Retry
+        state lives on the executable, so one executable must not be awaited twice at once.
+
+        Args:
+            client (Client): The client instance to use for execution
+            timeout (int | float, optional): The total execution timeout (in seconds) for this execution
+
+        Returns:
+            The result of execute(): the receipt for transactions, the mapped result for queries
+
+        Raises:
+            PrecheckError: If the operation fails with a non-retryable error
+            MaxAttemptsError: If the operation fails after the maximum number of attempts
+            ReceiptStatusError: If the operation fails with a receipt status error
+        """
+        return await asyncio.to_thread(self.execute, client, timeout)
+
+    @staticmethod
+    def _execute_batch(
+        client: Client,
+        executables: Sequence[_Executable],
+        max_workers: int | None = None,
+        timeout: int | float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Execute several transactions or queries with their gRPC calls in flight concurrently.
+
+        Each executable runs its own execute() on a worker thread, so transactions are frozen
+        and signed by the operator, and queries are paid for, exactly as when executed one at
+        a time. The network services only expose unary methods, so the calls are pipelined
+        rather than streamed, and the results are returned in the order the executables were given.
+
+        A failure does not stop the rest of the batch. Unless return_exceptions is set, the
+        first failure (in order) is raised once every executable has finished, and the results
+        of the ones that succeeded are discarded, even though those transactions were submitted.
+
+        All workers share the one client. Each node creates its channel under its own lock and
+        the network updates its healthy nodes under a lock, so concurrent executions neither leak
+        channels nor corrupt node health. Retry state lives on each executable, so an executable
+        may appear in the batch only once.
+
+        Args:
+            client (Client): The client instance to use for execution
+            executables (Sequence[_Executable]): The transactions or queries to execute
+            max_workers (int, optional): The maximum number of calls in flight at once.
+                Defaults to one per executable, up to _MAX_BATCH_WORKERS.
+            timeout (int | float, optional): The total execution timeout (in seconds) for each execution
+            return_exceptions (bool, optional): Return the error of a failed executable in its place
+                instead of raising it. Defaults to False.
+
+        Returns:
+            list: The result of each executable's execute() (the receipt, for transactions),
+                in the order they were given
+
+        Raises:
+            TypeError: If max_workers is not an int
+            ValueError: If max_workers is not greater than 0, or an executable appears more than once
+            PrecheckError: If an operation fails with a non-retryable error
+            MaxAttemptsError: If an operation fails after the maximum number of attempts
+            ReceiptStatusError: If an operation fails with a receipt status error
+        """
+        if max_workers is not None:
+            if isinstance(max_workers, bool) or not isinstance(max_workers, int):
+                raise TypeError(f"max_workers must be of type int, got {type(max_workers).__name__}")
+
+            if max_workers <= 0:
+                raise ValueError("max_workers must be greater than 0")
+
+        if not executables:
+            return []
+
+        if len({id(executable) for executable in executables}) != len(executables):
+            raise ValueError("executables must not contain the same executable more than once")
+
+        if max_workers is None:
+            max_workers = min(len(executables), _MAX_BATCH_WORKERS)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(executable.execute, client, timeout) for executable in executables]
+
+        # The pool only exits once every execution has finished
+        if return_exceptions:
+            return [future.exception() or future.result() for future in futures]
+        return [future.result() for future in futures]
+
+
+@functools.lru_cache(maxsize=32)
+def _backoff_schedule(min_backoff: float, max_backoff: float, max_attempts: int) -> tuple[float, ...]:
+    """
+    Build the backoff for every attempt, doubling from min_backoff and capped at max_backoff.
+
+    Executables almost always share the client's backoff configuration, so the
+    schedule is built once per configuration and shared between them.
+    """
+    schedule = []
+    backoff = min_backoff
+    for _ in range(max_attempts):
+        backoff = min(max_backoff, backoff * 2)
+        schedule.append(backoff)
+    return tuple(schedule)
+
 
 def _is_transaction_receipt_or_record_request(
     request: transaction_pb2.Transaction | query_pb2.Query,
@@ -543,13 +762,21 @@ def _is_transaction_receipt_or_record_request(
     return request.HasField("transactionGetReceipt") or request.HasField("transactionGetRecord")
 
 
-def _delay_for_attempt(request_id: str, backoff: float, attempt: int, logger: Logger, error) -> None:
+def _delay_for_attempt(
+    request_id: str,
+    backoff: float,
+    attempt: int,
+    logger: Logger,
+    error,
+    cancel_event: threading.Event,
+) -> None:
     """
     Delay for the specified backoff period before retrying.
 
     Args:
         attempt (int): The current attempt number (0-based)
         backoff (float): The current backoff period in seconds
+        cancel_event (threading.Event): Ends the delay early once set
     """
     logger.trace(
         "Retrying request attempt",
@@ -562,7 +789,7 @@ def _delay_for_attempt(request_id: str, backoff: float, attempt: int, logger: Lo
         "error",
         error,
     )
-    time.sleep(backoff)
+    cancel_event.wait(backoff)
 
 
 def _execute_method(method, proto_request, timeout: float):
@@ -580,8 +807,9 @@ def _execute_method(method, proto_request, timeout: float):
     Raises:
         Exception: If neither a transaction nor query method is available to execute
     """
-    if method.transaction is not None:
-        return method.transaction(proto_request, timeout=timeout)
-    if method.query is not None:
-        return method.query(proto_request, timeout=timeout)
+    return method._invoke(proto_request, timeout=timeout)
+
+
+def _raise_no_method(*_args, **_kwargs):
+    """Stand-in callable for a _Method that has neither a transaction nor a query function."""
     raise Exception("No method to execute")
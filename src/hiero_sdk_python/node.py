@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import socket
 import ssl  # Python's ssl module implements TLS (despite the name)
+import threading
 import time
 
 import grpc
@@ -89,6 +90,8 @@ class _Node:
         """
         self._account_id: AccountId = account_id
         self._channel: _Channel | None = None
+        # Guards channel creation, so concurrent executions on one client share a single channel
+        self._channel_lock = threading.Lock()
         self._address_book: NodeAddress = address_book
         self._address: _ManagedNodeAddress = _ManagedNodeAddress._from_string(address)
         self._verify_certificates: bool = True
@@ -108,9 +111,10 @@ class _Node:
         Returns:
             None
         """
-        if self._channel is not None:
-            self._channel.channel.close()
-            self._channel = None
+        with self._channel_lock:
+            if self._channel is not None:
+                self._channel.channel.close()
+                self._channel = None
 
     def _get_channel(self):
         """
@@ -122,37 +126,42 @@ class _Node:
         if self._channel:
             return self._channel
 
-        if self._address._is_transport_security():
-            if self._root_certificates:
-                # Use the certificate that is provided
-                self._node_pem_cert = self._root_certificates
+        with self._channel_lock:
+            # Another thread may have built the channel while this one waited for the lock
+            if self._channel:
+                return self._channel
 
-            else:
-                # Fetch pem_cert for the node
-                self._node_pem_cert = self._fetch_server_certificate_pem()
+            if self._address._is_transport_security():
+                if self._root_certificates:
+                    # Use the certificate that is provided
+                    self._node_pem_cert = self._root_certificates
 
-            if not self._node_pem_cert:
-                raise ValueError("No certificate available.")
+                else:
+                    # Fetch pem_cert for the node
+                    self._node_pem_cert = self._fetch_server_certificate_pem()
 
-            # Validate certificate if verification is enabled
-            if self._verify_certificates:
-                self._validate_tls_certificate_with_trust_manager()
+                if not self._node_pem_cert:
+                    raise ValueError("No certificate available.")
 
-            options = self._build_channel_options()
-            credentials = grpc.ssl_channel_credentials(
-                root_certificates=self._node_pem_cert,
-                private_key=None,
-                certificate_chain=None,
-            )
-            channel = grpc.secure_channel(str(self._address), credentials, options=options)
-        else:
-            channel = grpc.insecure_channel(str(self._address))
+                # Validate certificate if verification is enabled
+                if self._verify_certificates:
+                    self._validate_tls_certificate_with_trust_manager()
 
-        channel = grpc.intercept_channel(channel, _UserAgentInterceptor())
+                options = self._build_channel_options()
+                credentials = grpc.ssl_channel_credentials(
+                    root_certificates=self._node_pem_cert,
+                    private_key=None,
+                    certificate_chain=None,
+                )
+                channel = grpc.secure_channel(str(self._address), credentials, options=options)
+            else:
+                channel = grpc.insecure_channel(str(self._address))
+
+            channel = grpc.intercept_channel(channel, _UserAgentInterceptor())
 
-        self._channel = _Channel(channel)
+            self._channel = _Channel(channel)
 
-        return self._channel
+            return self._channel
 
     def _apply_transport_security(self, enabled: bool):
         """Update the node's address to use secure or insecure transport."""
@@ -347,7 +347,7 @@ class Query(_Executable):
         """
         return response
 
-    def _should_retry(self, response: Any) -> _ExecutionState:
+    def _should_retry(self, response: Any) -> int:
         """
         Determines whether the query should be retried based on the response.
 
@@ -358,7 +358,7 @@ class Query(_Executable):
             response: The response from the network
 
         Returns:
-            _ExecutionState: The execution state indicating what to do next
+            int: The _ExecutionState value indicating what to do next
         """
         query_response = self._get_query_response(response)
         status = query_response.header.nodeTransactionPrecheckCode
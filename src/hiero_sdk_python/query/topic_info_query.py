@@ -121,7 +121,7 @@ class TopicInfoQuery(Query):
         """
         return _Method(transaction_func=None, query_func=channel.topic.getTopicInfo)
 
-    def _should_retry(self, response: Any) -> _ExecutionState:
+    def _should_retry(self, response: Any) -> int:
         """
         Determines whether the query should be retried based on the response.
 
@@ -132,7 +132,7 @@ class TopicInfoQuery(Query):
             response: The response from the network
 
         Returns:
-            _ExecutionState: The execution state indicating what to do next
+            int: The _ExecutionState value indicating what to do next
         """
         status = response.consensusGetTopicInfo.header.nodeTransactionPrecheckCode
 
@@ -203,7 +203,7 @@ class TransactionGetReceiptQuery(Query):
         """
         return _Method(transaction_func=None, query_func=channel.crypto.getTransactionReceipts)
 
-    def _should_retry(self, response: response_pb2.Response) -> _ExecutionState:
+    def _should_retry(self, response: response_pb2.Response) -> int:
         """
         Determines whether the query should be retried based on the response.
 
@@ -215,7 +215,7 @@ class TransactionGetReceiptQuery(Query):
             response: The response from the network
 
         Returns:
-            _ExecutionState: The execution state indicating what to do next
+            int: The _ExecutionState value indicating what to do next
         """
         status = response.transactionGetReceipt.header.nodeTransactionPrecheckCode
 
@@ -175,7 +175,7 @@ class TransactionRecordQuery(Query):
         """
         return _Method(transaction_func=None, query_func=channel.crypto.getTxRecordByTxID)
 
-    def _should_retry(self, response: Any) -> _ExecutionState:
+    def _should_retry(self, response: Any) -> int:
         """
         Determines whether the query should be retried based on the response.
 
@@ -187,7 +187,7 @@ class TransactionRecordQuery(Query):
             response: The response from the network
 
         Returns:
-            _ExecutionState: The execution state indicating what to do next
+            int: The _ExecutionState value indicating what to do next
         """
         status = response.transactionGetRecord.header.nodeTransactionPrecheckCode
 
@@ -433,4 +433,9 @@ class ResponseCode(IntEnum):
             FutureWarning,
             stacklevel=2,
         )
-        return cls(code).name
+        name = _NAME_BY_CODE.get(code)
+        return name if name is not None else cls(code).name
+
+
+# Reverse index from code to member name, so get_name resolves a known code with one dict lookup
+_NAME_BY_CODE: dict[int, str] = {member.value: name for name, member in ResponseCode.__members__.items()}
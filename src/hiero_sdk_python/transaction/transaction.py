@@ -123,7 +123,7 @@ class Transaction(_Executable):
             response: The response from the network
 
         Returns:
-            _ExecutionState: The execution state indicating what to do next
+            int: The _ExecutionState value indicating what to do next
         """
         if not isinstance(response, TransactionResponseProto):
             raise ValueError(f"Expected TransactionResponseProto but got {type(response)}")
@@ -309,18 +309,33 @@ class Transaction(_Executable):
 
         # Multiple node
         if len(self.node_account_ids) > 0:
-            for node_account_id in self.node_account_ids:
-                self.node_account_id = node_account_id
-                self._transaction_body_bytes[node_account_id] = self.build_transaction_body().SerializeToString()
+            self._freeze_for_nodes(self.node_account_ids)
 
         else:
             # Use all nodes from client network
-            for node in client.network.nodes:
-                self.node_account_id = node._account_id
-                self._transaction_body_bytes[node._account_id] = self.build_transaction_body().SerializeToString()
+            self._freeze_for_nodes([node._account_id for node in client.network.nodes])
 
         return self
 
+    def _freeze_for_nodes(self, node_account_ids: list[AccountId]) -> None:
+        """
+        Serializes the transaction body for each of the given nodes.
+
+        The bodies only differ in nodeAccountID, so the body is built once and
+        re-serialized per node with that field swapped.
+
+        Args:
+            node_account_ids (list[AccountId]): The nodes to freeze the transaction for.
+        """
+        transaction_body = None
+        for node_account_id in node_account_ids:
+            self.node_account_id = node_account_id
+            if transaction_body is None:
+                transaction_body = self.build_transaction_body()
+            else:
+                transaction_body.nodeAccountID.CopyFrom(node_account_id._to_proto())
+            self._transaction_body_bytes[node_account_id] = transaction_body.SerializeToString()
+
     @overload
     def execute(
         self,
@@ -166,7 +166,7 @@ def test_account_create_transaction():
     ]
 
     # Use the context manager to set up and tear down the mock environment
-    with mock_hedera_servers(response_sequences) as client, patch("time.sleep"):
+    with mock_hedera_servers(response_sequences) as client, patch("hiero_sdk_python.executable._delay_for_attempt"):
         # Create the transaction
         new_key = PrivateKey.generate()
         transaction = (
@@ -63,6 +63,19 @@ def test_max_attempts_error_typing():
     assert "Network timeout" in str(err_runtime)
 
 
+def test_max_attempts_error_structured_fields():
+    """Test MaxAttemptsError exposes the attempt count and the last error's status."""
+    precheck_error = PrecheckError(ResponseCode.BUSY)
+    err = MaxAttemptsError("Max attempts reached", "0.0.3", precheck_error, attempts=3)
+    assert err.attempts == 3
+    assert err.last_status == ResponseCode.BUSY
+
+    # Errors that carry no status leave last_status unset
+    err_grpc = MaxAttemptsError("Max attempts reached", "0.0.3", ValueError("Connection failed"))
+    assert err_grpc.attempts is None
+    assert err_grpc.last_status is None
+
+
 def test_receipt_status_error_typing():
     """Test ReceiptStatusError initialization."""
     tx_id_mock = Mock()
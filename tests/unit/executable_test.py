@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from itertools import chain, repeat
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import grpc
 import pytest
@@ -12,7 +15,13 @@ from hiero_sdk_python.consensus.topic_create_transaction import TopicCreateTrans
 from hiero_sdk_python.crypto.private_key import PrivateKey
 from hiero_sdk_python.exceptions import MaxAttemptsError, PrecheckError
 from hiero_sdk_python.executable import (
+    _MAX_BATCH_WORKERS,
+    _delay_for_attempt,
+    _Executable,
+    _execute_method,
+    _ExecutionState,
     _is_transaction_receipt_or_record_request,
+    _Method,
 )
 from hiero_sdk_python.hapi.services import (
     basic_types_pb2,
@@ -33,369 +42,347 @@ from hiero_sdk_python.query.transaction_get_receipt_query import (
 from hiero_sdk_python.query.transaction_record_query import TransactionRecordQuery
 from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.transaction.transaction_id import TransactionId
-from tests.unit.mock_server import RealRpcError, mock_hedera_servers
+from tests.unit.mock_server import MockCluster, _rpc_err
 
 
 pytestmark = pytest.mark.unit
 
-
-def test_retry_success_before_max_attempts():
-    """Test that execution succeeds on the last attempt before max_attempts."""
-    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(
-                status=ResponseCode.SUCCESS,
-                accountID=basic_types_pb2.AccountID(shardNum=0, realmNum=0, accountNum=1234),
-            ),
-        )
+# Responses shared by the tests; the mock servers only serialize them, so reusing them is safe
+_PRECHECK = {
+    code: TransactionResponseProto(nodeTransactionPrecheckCode=code)
+    for code in (
+        ResponseCode.OK,
+        ResponseCode.BUSY,
+        ResponseCode.TRANSACTION_EXPIRED,
+        ResponseCode.INVALID_TRANSACTION_BODY,
+        ResponseCode.INVALID_NODE_ACCOUNT,
     )
+}
+# Short names for the precheck responses most sequences are built from
+_BUSY = _PRECHECK[ResponseCode.BUSY]
+_OK = _PRECHECK[ResponseCode.OK]
+_EXPIRED = _PRECHECK[ResponseCode.TRANSACTION_EXPIRED]
+_INVALID_BODY = _PRECHECK[ResponseCode.INVALID_TRANSACTION_BODY]
 
-    # First server gives 2 BUSY responses then OK on the 3rd try
-    response_sequences = [[busy_response, busy_response, ok_response, receipt_response]]
-
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        # Configure client to allow 3 attempts - should succeed on the last try
-        client.max_attempts = 3
-
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
-
-        try:
-            receipt = transaction.execute(client)
-        except (Exception, grpc.RpcError) as e:
-            pytest.fail(f"Transaction execution should not raise an exception, but raised: {e}")
-
-        assert receipt.status == ResponseCode.SUCCESS
-
+_UNAVAILABLE_ERR = _rpc_err(grpc.StatusCode.UNAVAILABLE)
 
-def test_retry_failure_after_max_attempts():
-    """Test that execution fails after max_attempts with retriable errors."""
-    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
+# Account IDs of the nodes served by the mock cluster, keyed by account number
+_NODE = {num: AccountId(0, 0, num) for num in (3, 4, 5)}
 
-    response_sequences = [[busy_response, busy_response]]
-
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        client.max_attempts = 2
-
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
-
-        # Should raise an exception after max attempts
-        with pytest.raises(MaxAttemptsError) as excinfo:
-            transaction.execute(client)
-
-        # Verify the exception contains information about retry exhaustion
-        error_message = str(excinfo.value)
-        assert "Exceeded maximum attempts" in error_message
-        assert "failed precheck with status: BUSY" in error_message
+_OK_HEADER = response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK)
 
+_SUCCESS_RECEIPT = response_pb2.Response(
+    transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+        header=_OK_HEADER,
+        receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
+    )
+)
 
-def test_node_switching_after_single_grpc_error():
-    """Test that execution switches nodes after receiving a non-retriable error."""
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-    error = RealRpcError(grpc.StatusCode.UNAVAILABLE, "Test error")
+_SUCCESS_RECEIPT_WITH_ACCOUNT = response_pb2.Response(
+    transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+        header=_OK_HEADER,
+        receipt=transaction_receipt_pb2.TransactionReceipt(
+            status=ResponseCode.SUCCESS,
+            accountID=basic_types_pb2.AccountID(shardNum=0, realmNum=0, accountNum=1234),
+        ),
+    )
+)
 
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
+_SUCCESS_RECEIPT_WITH_TOPIC = response_pb2.Response(
+    transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+        header=_OK_HEADER,
+        receipt=transaction_receipt_pb2.TransactionReceipt(
+            status=ResponseCode.SUCCESS,
+            topicID=basic_types_pb2.TopicID(shardNum=0, realmNum=0, topicNum=456),
+        ),
     )
+)
 
-    # First node gives error, second node gives OK, third node gives error
-    response_sequences = [
-        [error],
-        [ok_response, receipt_response],
-        [error],
-    ]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
+@pytest.fixture(scope="module")
+def mock_cluster():
+    """Mock servers started once for the module; each test serves its own responses."""
+    cluster = MockCluster().start()
+    yield cluster
+    cluster.stop()
 
-        try:
-            transaction.execute(client)
-        except (Exception, grpc.RpcError) as e:
-            pytest.fail(f"Transaction execution should not raise an exception, but raised: {e}")
-        # Verify we're now on the second node
-        assert transaction.node_account_ids[transaction._node_account_ids_index] == AccountId(0, 0, 4), (
-            "Client should have switched to the second node"
-        )
 
+@pytest.fixture(scope="module")
+def shared_pubkey():
+    """One public key for every test in the module; none of them depend on key uniqueness."""
+    return PrivateKey.generate().public_key()
 
-def test_node_switching_after_multiple_grpc_errors():
-    """Test that execution switches nodes after receiving multiple non-retriable errors."""
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-    error_response = RealRpcError(grpc.StatusCode.UNAVAILABLE, "Test error")
 
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
+@pytest.fixture(autouse=True)
+def _no_retry_delay(monkeypatch):
+    """Skip the real retry backoff in every test."""
+    monkeypatch.setattr("hiero_sdk_python.executable._delay_for_attempt", lambda *_args: None)
 
-    response_sequences = [
-        [error_response, error_response],
-        [error_response, error_response],
-        [ok_response, receipt_response],
-    ]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
+@pytest.fixture
+def retry_delays(monkeypatch):
+    """Record the arguments of every retry delay instead of waiting."""
+    delays = []
+    monkeypatch.setattr("hiero_sdk_python.executable._delay_for_attempt", lambda *args: delays.append(args))
+    return delays
 
-        try:
-            receipt = transaction.execute(client)
-        except (Exception, grpc.RpcError) as e:
-            pytest.fail(f"Transaction execution should not raise an exception, but raised: {e}")
 
-        # Verify we're now on the third node
-        assert transaction.node_account_ids[transaction._node_account_ids_index] == AccountId(0, 0, 5), (
-            "Client should have switched to the third node"
-        )
-        assert receipt.status == ResponseCode.SUCCESS
+def _account_create(pubkey):
+    return AccountCreateTransaction().set_key_without_alias(pubkey).set_initial_balance(100_000_000)
 
 
-def test_transaction_with_expired_error_not_retried():
-    """Test that an expired error is not retried."""
-    error_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.TRANSACTION_EXPIRED)
+def _topic_create(pubkey):
+    return TopicCreateTransaction().set_memo("Test retry flow").set_admin_key(pubkey)
 
-    response_sequences = [[error_response]]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
+def _assert_success(receipt, served_response=_SUCCESS_RECEIPT):
+    """Assert the receipt succeeded and carries what the mock node served, e.g. the created account or topic."""
+    assert receipt.status == ResponseCode.SUCCESS
+    assert receipt._to_proto() == served_response.transactionGetReceipt.receipt
 
-        with pytest.raises(PrecheckError) as exc_info:
-            transaction.execute(client)
 
-        assert str(error_response.nodeTransactionPrecheckCode) in str(exc_info.value)
+@pytest.mark.parametrize(
+    "build_transaction, response_sequences, max_attempts, expected_error, expected_status, expected_delays, expected_node",
+    [
+        pytest.param(
+            _account_create,
+            [[_BUSY, _BUSY, _OK, _SUCCESS_RECEIPT_WITH_ACCOUNT]],
+            3,
+            None,
+            ResponseCode.SUCCESS,
+            2,
+            _NODE[3],
+            id="succeeds_on_last_attempt",
+        ),
+        pytest.param(
+            _account_create,
+            [[_EXPIRED]],
+            4,
+            PrecheckError,
+            ResponseCode.TRANSACTION_EXPIRED,
+            0,
+            _NODE[3],
+            id="expired_not_retried",
+        ),
+        pytest.param(
+            _account_create,
+            [[_INVALID_BODY]],
+            4,
+            PrecheckError,
+            ResponseCode.INVALID_TRANSACTION_BODY,
+            0,
+            _NODE[3],
+            id="fatal_not_retried",
+        ),
+        pytest.param(
+            _account_create,
+            [[_BUSY, _OK, _SUCCESS_RECEIPT]],
+            4,
+            None,
+            ResponseCode.SUCCESS,
+            1,
+            _NODE[3],
+            id="retries_on_busy",
+        ),
+        pytest.param(
+            _account_create,
+            [[_BUSY], [_OK, _SUCCESS_RECEIPT]],
+            4,
+            None,
+            ResponseCode.SUCCESS,
+            1,
+            _NODE[4],
+            id="busy_moves_to_next_node",
+        ),
+        pytest.param(
+            _topic_create,
+            [[_BUSY, _OK, _SUCCESS_RECEIPT_WITH_TOPIC]],
+            3,
+            None,
+            ResponseCode.SUCCESS,
+            1,
+            _NODE[3],
+            id="topic_create_retries_on_busy",
+        ),
+        pytest.param(
+            _topic_create,
+            [[_INVALID_BODY]],
+            4,
+            PrecheckError,
+            ResponseCode.INVALID_TRANSACTION_BODY,
+            0,
+            _NODE[3],
+            id="topic_create_fails_on_nonretriable_error",
+        ),
+    ],
+)
+def test_executable_precheck_flow(
+    mock_cluster,
+    build_transaction,
+    response_sequences,
+    max_attempts,
+    expected_error,
+    expected_status,
+    expected_delays,
+    expected_node,
+    retry_delays,
+    shared_pubkey,
+):
+    """Test how precheck responses are retried, finished or raised, and which node ends up serving them."""
+    with mock_cluster.serve(response_sequences, max_attempts=max_attempts) as client:
+        transaction = build_transaction(shared_pubkey)
+
+        if expected_error is None:
+            receipt = transaction.execute(client)
+            assert receipt.status == expected_status
+            _assert_success(receipt, response_sequences[-1][-1])
+        else:
+            with pytest.raises(expected_error) as excinfo:
+                transaction.execute(client)
+            assert excinfo.value.status == expected_status
 
+        assert len(retry_delays) == expected_delays
+        assert transaction.node_account_id == expected_node
 
-def test_transaction_with_fatal_error_not_retried():
-    """Test that a fatal error is not retried."""
-    error_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.INVALID_TRANSACTION_BODY)
 
-    response_sequences = [[error_response]]
+def test_retry_failure_after_max_attempts(mock_cluster, retry_delays, shared_pubkey):
+    """Test that execution fails after max_attempts with retriable errors."""
+    response_sequences = [[_BUSY, _BUSY]]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
+    with mock_cluster.serve(response_sequences, max_attempts=2) as client:
+        transaction = _account_create(shared_pubkey)
 
-        with pytest.raises(PrecheckError) as exc_info:
+        with pytest.raises(MaxAttemptsError) as excinfo:
             transaction.execute(client)
 
-        assert str(error_response.nodeTransactionPrecheckCode) in str(exc_info.value)
-
+        # Retry exhaustion is reported through the error's fields rather than its message
+        assert excinfo.value.attempts == 2
+        assert excinfo.value.last_status == ResponseCode.BUSY
+        assert excinfo.value.node_id == _NODE[3]
+        assert len(retry_delays) == 2
 
-def test_exponential_backoff_retry():
-    """Test that the retry mechanism uses exponential backoff."""
-    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
 
-    # Create several BUSY responses to force multiple retries
-    response_sequences = [[busy_response, busy_response, busy_response, ok_response, receipt_response]]
+@pytest.mark.parametrize(
+    "response_sequences, expected_requests",
+    [
+        pytest.param([[_BUSY, _BUSY, _OK]], 1, id="retries_on_same_node"),
+        pytest.param([[_UNAVAILABLE_ERR], [_OK]], 2, id="switches_node"),
+        # Three attempts (node 3, node 4, node 3 again) but only one request per node
+        pytest.param([[_BUSY, _OK], [_BUSY]], 2, id="returns_to_first_node"),
+    ],
+)
+def test_execution_builds_one_request_per_node(mock_cluster, shared_pubkey, response_sequences, expected_requests):
+    """Each node gets its method and request built once, and every attempt on it sends that same request."""
+    with mock_cluster.serve(response_sequences) as client:
+        transaction = _account_create(shared_pubkey).freeze_with(client)
 
-    # Use a mock for time.sleep to capture the delay values
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep") as mock_sleep,
-    ):
-        client.max_attempts = 5
+        with (
+            patch.object(transaction, "_make_request", wraps=transaction._make_request) as mock_make_request,
+            patch.object(transaction, "_get_method", wraps=transaction._get_method) as mock_get_method,
+            patch("hiero_sdk_python.executable._execute_method", wraps=_execute_method) as mock_execute_method,
+        ):
+            transaction.execute(client, wait_for_receipt=False)
 
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
+        assert mock_make_request.call_count == expected_requests
+        assert mock_get_method.call_count == expected_requests
+        sent_requests = {id(call_args[0][1]) for call_args in mock_execute_method.call_args_list}
+        assert len(sent_requests) == expected_requests
 
-        try:
-            transaction.execute(client)
-        except (Exception, grpc.RpcError) as e:
-            pytest.fail(f"Transaction execution should not raise an exception, but raised: {e}")
 
-        # Check that time.sleep was called the expected number of times (3 retries)
-        assert mock_sleep.call_count == 3, f"Expected 3 sleep calls, got {mock_sleep.call_count}"
+def test_request_id_is_generated_once_per_execution(mock_cluster, retry_delays, shared_pubkey):
+    """Test that all attempts of one execution are logged under the same request ID."""
+    response_sequences = [[_BUSY, _BUSY, _OK]]
 
-        # Verify exponential backoff by checking sleep durations are increasing
-        sleep_args = [call_args[0][0] for call_args in mock_sleep.call_args_list]
+    with mock_cluster.serve(response_sequences) as client:
+        transaction = _account_create(shared_pubkey).freeze_with(client)
 
-        # Verify each subsequent delay is double than the previous
-        for i in range(1, len(sleep_args)):
-            assert abs(sleep_args[i] - sleep_args[i - 1] * 2) < 0.1, f"Expected doubling delays, but got {sleep_args}"
+        with patch.object(transaction, "_get_request_id", return_value="request-1") as mock_request_id:
+            transaction.execute(client, wait_for_receipt=False)
 
+        mock_request_id.assert_called_once()
+        assert [args[0] for args in retry_delays] == ["request-1", "request-1"]
 
-def test_retriable_error_does_not_switch_node():
-    """Test that a retriable error does not switch nodes."""
-    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
 
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
-    response_sequences = [[busy_response, ok_response, receipt_response]]
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        transaction = (
-            AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
-            .set_initial_balance(100_000_000)
-        )
+def test_node_switching_after_single_grpc_error(mock_cluster, shared_pubkey):
+    """Test that execution switches nodes after receiving a non-retriable error."""
+    # First node gives error, second node gives OK, third node gives error
+    response_sequences = [
+        [_UNAVAILABLE_ERR],
+        [_OK, _SUCCESS_RECEIPT],
+        [_UNAVAILABLE_ERR],
+    ]
 
-        try:
-            transaction.execute(client)
-        except (Exception, grpc.RpcError) as e:
-            pytest.fail(f"Transaction execution should not raise an exception, but raised: {e}")
+    with mock_cluster.serve(response_sequences) as client:
+        transaction = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(100_000_000)
 
-        assert client.network.current_node._account_id == AccountId(0, 0, 3), (
-            "Client should not switch node on retriable errors"
+        transaction.execute(client)
+        # Verify we're now on the second node
+        assert transaction.node_account_ids[transaction._node_account_ids_index] == _NODE[4], (
+            "Client should have switched to the second node"
         )
 
 
-def test_topic_create_transaction_retry_on_busy():
-    """Test that TopicCreateTransaction retries on BUSY response."""
-    # First response is BUSY, second is OK
-    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
-
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(
-                status=ResponseCode.SUCCESS,
-                topicID=basic_types_pb2.TopicID(shardNum=0, realmNum=0, topicNum=456),
-            ),
-        )
-    )
-
+def test_node_switching_after_multiple_grpc_errors(mock_cluster, shared_pubkey):
+    """Test that execution switches nodes after receiving multiple non-retriable errors."""
     response_sequences = [
-        [busy_response, ok_response, receipt_response],
+        [_UNAVAILABLE_ERR, _UNAVAILABLE_ERR],
+        [_UNAVAILABLE_ERR, _UNAVAILABLE_ERR],
+        [_OK, _SUCCESS_RECEIPT],
     ]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep") as mock_sleep,
-    ):
-        client.max_attempts = 3
+    with mock_cluster.serve(response_sequences) as client:
+        transaction = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(100_000_000)
 
-        tx = TopicCreateTransaction().set_memo("Test with retry").set_admin_key(PrivateKey.generate().public_key())
+        receipt = transaction.execute(client)
 
-        try:
-            receipt = tx.execute(client)
-        except Exception as e:
-            pytest.fail(f"Should not raise exception, but raised: {e}")
-        # Verify transaction succeeded after retry
-        assert receipt.status == ResponseCode.SUCCESS
-        assert receipt.topic_id.num == 456
+        # Verify we're now on the third node
+        assert transaction.node_account_ids[transaction._node_account_ids_index] == _NODE[5], (
+            "Client should have switched to the third node"
+        )
+        _assert_success(receipt)
 
-        # Verify we slept once for the retry
-        assert mock_sleep.call_count == 1, "Should have retried once"
 
-        # Verify we didn't switch nodes (BUSY is retriable without node switch)
-        assert client.network.current_node._account_id == AccountId(0, 0, 3), "Should not have switched nodes on BUSY"
+def test_exponential_backoff_retry(mock_cluster, retry_delays, shared_pubkey):
+    """Test that the retry mechanism uses exponential backoff."""
+    # Create several BUSY responses to force multiple retries
+    response_sequences = [[_BUSY, _BUSY, _BUSY, _OK, _SUCCESS_RECEIPT]]
+    min_backoff, max_backoff = 0.25, 1.5
 
+    # Pin the jitter to the upper bound so the exponential envelope is observable
+    with (
+        mock_cluster.serve(response_sequences, max_attempts=5) as client,
+        patch("hiero_sdk_python.executable._BACKOFF_RNG.uniform", side_effect=lambda _low, high: high),
+    ):
+        transaction = _account_create(shared_pubkey).set_min_backoff(min_backoff).set_max_backoff(max_backoff)
 
-def test_topic_create_transaction_fails_on_nonretriable_error():
-    """Test that TopicCreateTransaction fails on non-retriable error."""
-    # Create a response with a non-retriable error
-    error_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.INVALID_TRANSACTION_BODY)
+        transaction.execute(client)
 
-    response_sequences = [
-        [error_response],
-    ]
+        # Check that the retry delay was applied the expected number of times (3 retries)
+        assert len(retry_delays) == 3, f"Expected 3 sleep calls, got {len(retry_delays)}"
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
-        tx = TopicCreateTransaction().set_memo("Test with error").set_admin_key(PrivateKey.generate().public_key())
+        # Each delay doubles from min_backoff and is capped at max_backoff: 0.5, 1.0, then 1.5 instead of 2.0
+        sleep_args = [args[1] for args in retry_delays]
+        expected = [min(max_backoff, min_backoff * 2 ** (attempt + 1)) for attempt in range(len(sleep_args))]
 
-        with pytest.raises(PrecheckError, match="failed precheck with status: INVALID_TRANSACTION_BODY"):
-            tx.execute(client)
+        assert sleep_args == expected, f"Expected doubling delays, but got {sleep_args}"
 
 
-def test_transaction_node_switching_body_bytes():
+def test_transaction_node_switching_body_bytes(mock_cluster, shared_pubkey):
     """Test that execution switches nodes after receiving a non-retriable error."""
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-    error = RealRpcError(grpc.StatusCode.UNAVAILABLE, "Test error")
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
     # First node gives error, second node gives OK, third node gives error
     response_sequences = [
-        [error],
-        [ok_response, receipt_response],
+        [_UNAVAILABLE_ERR],
+        [_OK, _SUCCESS_RECEIPT],
     ]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
-    ):
+    with mock_cluster.serve(response_sequences) as client:
         # We set the current node to 0
         client.network._node_index = 0
         client.network.current_node = client.network.nodes[0]
 
         transaction = (
             AccountCreateTransaction()
-            .set_key_without_alias(PrivateKey.generate().public_key())
+            .set_key_without_alias(shared_pubkey)
             .set_initial_balance(100_000_000)
             .freeze_with(client)
             .sign(client.operator_private_key)
@@ -412,17 +399,14 @@ def test_transaction_node_switching_body_bytes():
                 "Signature should be for the operator"
             )
 
-        try:
-            transaction.execute(client)
-        except (Exception, grpc.RpcError) as e:
-            pytest.fail(f"Transaction execution should not raise an exception, but raised: {e}")
+        transaction.execute(client)
         # Verify we're now on the second node
-        assert transaction.node_account_ids[transaction._node_account_ids_index] == AccountId(0, 0, 4), (
+        assert transaction.node_account_ids[transaction._node_account_ids_index] == _NODE[4], (
             "Client should have switched to the second node"
         )
 
 
-def test_query_retry_on_busy():
+def test_query_retry_on_busy(mock_cluster, retry_delays):
     """
     Test query retry behavior when receiving BUSY response.
 
@@ -431,7 +415,7 @@ def test_query_retry_on_busy():
     2. Second node returns OK response with the balance
 
     Verifies that the query successfully retries on a different node after receiving BUSY,
-    that the balance is returned correctly and that time.sleep was called once for the retry delay.
+    that the balance is returned correctly and that the retry delay was applied once.
     """
     # Create a BUSY response to simulate a node being temporarily unavailable
     # This response indicates the node cannot process the request at this time
@@ -458,10 +442,7 @@ def test_query_retry_on_busy():
         [ok_response],
     ]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep") as mock_sleep,
-    ):
+    with mock_cluster.serve(response_sequences) as client:
         # We set the current node to the first node so we are sure it will return BUSY response
         client.network._node_index = 0
         client.network.current_node = client.network.nodes[0]
@@ -472,16 +453,210 @@ def test_query_retry_on_busy():
         balance = query.execute(client)
 
         # Verify we slept once for the retry
-        assert mock_sleep.call_count == 1, "Should have retried once"
+        assert len(retry_delays) == 1, "Should have retried once"
 
         assert balance.hbars.to_tinybars() == 100000000
         # Verify we switched to the second node
         assert query._node_account_ids_index == 1
-        assert query.node_account_ids[query._node_account_ids_index] == AccountId(0, 0, 4), (
+        assert query.node_account_ids[query._node_account_ids_index] == _NODE[4], (
             "Client should have switched to the second node"
         )
 
 
+def test_execute_batch_returns_results_in_order(mock_cluster, shared_pubkey):
+    """Test that a batch runs each transaction's execute() and keeps the input order."""
+    response_sequences = [[_OK, _SUCCESS_RECEIPT] for _ in _NODE]
+
+    with mock_cluster.serve(response_sequences) as client:
+        # One node per transaction, so each node serves its own submission and receipt
+        transactions = [_account_create(shared_pubkey).set_node_account_id(node) for node in _NODE.values()]
+
+        receipts = _Executable._execute_batch(client, transactions, max_workers=2)
+
+        operator_key = client.operator_private_key.public_key()
+        assert [receipt.transaction_id for receipt in receipts] == [tx.transaction_id for tx in transactions]
+        assert all(receipt.status == ResponseCode.SUCCESS for receipt in receipts)
+        # execute() froze and signed every transaction before sending it
+        assert all(tx.is_signed_by(operator_key) for tx in transactions)
+
+
+def test_execute_batch_raises_first_failure(mock_cluster, shared_pubkey):
+    """Test that a failing executable in a batch surfaces its error."""
+    response_sequences = [[_INVALID_BODY]]
+
+    with mock_cluster.serve(response_sequences) as client, pytest.raises(PrecheckError):
+        _Executable._execute_batch(client, [_account_create(shared_pubkey)])
+
+
+def test_execute_batch_can_return_exceptions(mock_cluster, shared_pubkey):
+    """Test that return_exceptions keeps the results of the executables that succeeded."""
+    response_sequences = [[_INVALID_BODY], [_OK, _SUCCESS_RECEIPT]]
+
+    with mock_cluster.serve(response_sequences) as client:
+        transactions = [
+            _account_create(shared_pubkey).set_node_account_id(_NODE[3]),
+            _account_create(shared_pubkey).set_node_account_id(_NODE[4]),
+        ]
+
+        failure, receipt = _Executable._execute_batch(client, transactions, return_exceptions=True)
+
+        assert isinstance(failure, PrecheckError)
+        assert failure.status == ResponseCode.INVALID_TRANSACTION_BODY
+        assert receipt.status == ResponseCode.SUCCESS
+
+
+def test_execute_batch_caps_default_workers():
+    """Test that a large batch does not start one thread per executable by default."""
+    executables = [MagicMock() for _ in range(_MAX_BATCH_WORKERS * 2)]
+
+    with patch("hiero_sdk_python.executable.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+        results = _Executable._execute_batch("client", executables, timeout=5)
+
+    pool.assert_called_once_with(max_workers=_MAX_BATCH_WORKERS)
+    assert results == [executable.execute.return_value for executable in executables]
+    for executable in executables:
+        executable.execute.assert_called_once_with("client", 5)
+
+
+def test_execute_async_runs_concurrently_on_event_loop(mock_cluster, shared_pubkey):
+    """Test that several executions can be awaited together from one event loop."""
+    response_sequences = [[_OK, _SUCCESS_RECEIPT] for _ in range(2)]
+
+    with mock_cluster.serve(response_sequences) as client:
+        transactions = [_account_create(shared_pubkey).set_node_account_id(_NODE[3 + i]) for i in range(2)]
+
+        async def execute_all():
+            return await asyncio.gather(*(tx._execute_async(client) for tx in transactions))
+
+        receipts = asyncio.run(execute_all())
+
+        assert [receipt.transaction_id for receipt in receipts] == [tx.transaction_id for tx in transactions]
+        # The public execute() froze and signed each transaction
+        operator_key = client.operator_private_key.public_key()
+        assert all(tx.is_signed_by(operator_key) for tx in transactions)
+
+
+def test_delay_for_attempt_waits_on_cancel_event():
+    """Test that the retry delay waits on the cancel event for the backoff period."""
+    cancel_event = MagicMock()
+
+    _delay_for_attempt("request", 2.5, 0, MagicMock(), None, cancel_event)
+
+    cancel_event.wait.assert_called_once_with(2.5)
+
+
+def test_client_close_stops_retrying_execution(mock_cluster, monkeypatch, shared_pubkey):
+    """Test that closing the client wakes a retry backoff and stops further attempts."""
+    # This test needs the real delay, which waits on the client's shutdown event
+    monkeypatch.setattr("hiero_sdk_python.executable._delay_for_attempt", _delay_for_attempt)
+
+    response_sequences = [[_BUSY, _BUSY, _BUSY]]
+
+    with mock_cluster.serve(response_sequences) as client:
+        transaction = _account_create(shared_pubkey).freeze_with(client)
+        shutdown_event = client._shutdown_event
+
+        # Close the client while the first backoff is in progress
+        with (
+            patch.object(transaction, "_calculate_jittered_backoff", return_value=30),
+            patch.object(shutdown_event, "wait", side_effect=lambda _timeout: client.close()) as mock_wait,
+            patch.object(transaction, "_make_request", wraps=transaction._make_request) as mock_make_request,
+            pytest.raises(MaxAttemptsError, match="cancelled because the client was closed") as excinfo,
+        ):
+            transaction.execute(client, wait_for_receipt=False)
+
+        assert excinfo.value.attempts == 1
+        assert excinfo.value.last_status == ResponseCode.BUSY
+
+        mock_wait.assert_called_once_with(30)
+        assert mock_make_request.call_count == 1
+        assert shutdown_event.is_set()
+        # The client remains usable after close()
+        assert client._shutdown_event is not shutdown_event
+        assert not client._shutdown_event.is_set()
+
+
+def test_execute_batch_with_no_executables():
+    """Test that an empty batch returns no responses without touching the network."""
+    assert _Executable._execute_batch(None, []) == []
+
+
+@pytest.mark.parametrize("invalid_max_workers", ["1", 1.5, True, False, object()])
+def test_execute_batch_with_invalid_max_workers_type(invalid_max_workers):
+    """Test that _execute_batch rejects a non-integer max_workers."""
+    with pytest.raises(TypeError, match="max_workers must be of type int"):
+        _Executable._execute_batch(None, [AccountCreateTransaction()], max_workers=invalid_max_workers)
+
+
+@pytest.mark.parametrize("invalid_max_workers", [0, -1])
+def test_execute_batch_with_invalid_max_workers_value(invalid_max_workers):
+    """Test that _execute_batch rejects a max_workers that is not positive."""
+    with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+        _Executable._execute_batch(None, [AccountCreateTransaction()], max_workers=invalid_max_workers)
+
+
+def test_execute_batch_with_repeated_executable():
+    """Test that _execute_batch rejects an executable that appears more than once."""
+    transaction = AccountCreateTransaction()
+
+    with pytest.raises(ValueError, match="the same executable more than once"):
+        _Executable._execute_batch(None, [transaction, transaction])
+
+
+def test_execute_method_calls_transaction_func():
+    """Test that _execute_method invokes the transaction function with the deadline."""
+    transaction_func = MagicMock(return_value="response")
+    query_func = MagicMock()
+
+    response = _execute_method(_Method(query_func=query_func, transaction_func=transaction_func), "request", 5)
+
+    assert response == "response"
+    transaction_func.assert_called_once_with("request", timeout=5)
+    query_func.assert_not_called()
+
+
+def test_execute_method_calls_query_func():
+    """Test that _execute_method invokes the query function when there is no transaction function."""
+    query_func = MagicMock(return_value="response")
+
+    assert _execute_method(_Method(query_func=query_func), "request", 5) == "response"
+    query_func.assert_called_once_with("request", timeout=5)
+
+
+def test_execute_method_without_method_raises():
+    """Test that _execute_method raises when the method has nothing to call."""
+    with pytest.raises(Exception, match="No method to execute"):
+        _execute_method(_Method(), "request", 5)
+
+
+def test_backoff_and_deadline_properties_reflect_setters():
+    """Test that the read-only configuration properties expose the validated setter values."""
+    tx = AccountCreateTransaction()
+    assert tx.grpc_deadline is None
+    assert tx.min_backoff is None
+    assert tx.max_backoff is None
+
+    tx.set_grpc_deadline(5).set_min_backoff(1).set_max_backoff(4)
+
+    assert tx.grpc_deadline == 5.0
+    assert tx.min_backoff == 1.0
+    assert tx.max_backoff == 4.0
+
+
+@pytest.mark.parametrize("name", ["grpc_deadline", "min_backoff", "max_backoff"])
+def test_backoff_and_deadline_properties_are_read_only(name):
+    """Test that the configuration properties can only be changed through their validating setters."""
+    with pytest.raises(AttributeError):
+        setattr(AccountCreateTransaction(), name, 1)
+
+
+def test_execution_states_have_names():
+    """Test that each execution state maps to the name used when logging it."""
+    states = (_ExecutionState.RETRY, _ExecutionState.FINISHED, _ExecutionState.ERROR, _ExecutionState.EXPIRED)
+
+    assert [_ExecutionState.NAMES[state] for state in states] == ["RETRY", "FINISHED", "ERROR", "EXPIRED"]
+
+
 # Set max_attempts
 def test_set_max_attempts_with_valid_param():
     """Test that set_max_attempts for the transaction and query."""
@@ -806,6 +981,75 @@ def test_backoff_is_capped_by_max_backoff():
     assert tx._calculate_backoff(1) == 5
 
 
+def test_backoff_schedule_is_precomputed_on_resolve(mock_client):
+    """Resolving the execution config precomputes a capped backoff for every attempt."""
+    tx = AccountCreateTransaction().set_min_backoff(1).set_max_backoff(5).set_max_attempts(4)
+
+    tx._resolve_execution_config(mock_client, None)
+
+    assert tx._backoff_schedule == (2, 4, 5, 5)
+    assert [tx._calculate_backoff(attempt) for attempt in range(4)] == [2, 4, 5, 5]
+
+
+def test_backoff_past_schedule_keeps_last_backoff(mock_client):
+    """Attempts past the end of the precomputed schedule reuse its last backoff."""
+    tx = AccountCreateTransaction().set_min_backoff(1).set_max_backoff(100).set_max_attempts(3)
+
+    tx._resolve_execution_config(mock_client, None)
+
+    assert tx._backoff_schedule == (2, 4, 8)
+    assert tx._calculate_backoff(3) == tx._calculate_backoff(10) == 8
+
+
+def test_backoff_schedule_is_shared_between_executables(mock_client):
+    """Executables with the same backoff configuration share one precomputed schedule."""
+    first = AccountCreateTransaction()
+    second = AccountCreateTransaction()
+
+    first._resolve_execution_config(mock_client, None)
+    second._resolve_execution_config(mock_client, None)
+
+    assert first._backoff_schedule is second._backoff_schedule
+
+
+@pytest.mark.parametrize(
+    "setter, value",
+    [("set_min_backoff", 0.5), ("set_max_backoff", 10), ("set_max_attempts", 2)],
+)
+def test_backoff_setters_invalidate_backoff_schedule(mock_client, setter, value):
+    """Changing the backoff configuration discards the precomputed schedule."""
+    tx = AccountCreateTransaction().set_min_backoff(1).set_max_backoff(5)
+    tx._resolve_execution_config(mock_client, None)
+    assert tx._backoff_schedule
+
+    getattr(tx, setter)(value)
+
+    assert tx._backoff_schedule == ()
+
+
+def test_jittered_backoff_is_bounded_by_min_and_exponential_backoff():
+    """Jittered backoff must stay between min_backoff and the exponential backoff."""
+    tx = AccountCreateTransaction()
+    tx.set_min_backoff(1)
+    tx.set_max_backoff(8)
+
+    for attempt in range(5):
+        delay = tx._calculate_jittered_backoff(attempt)
+        assert 1 <= delay <= tx._calculate_backoff(attempt)
+
+
+def test_jittered_backoff_draws_from_backoff_rng():
+    """Jittered backoff samples uniformly between min_backoff and the exponential backoff."""
+    tx = AccountCreateTransaction()
+    tx.set_min_backoff(1)
+    tx.set_max_backoff(8)
+
+    with patch("hiero_sdk_python.executable._BACKOFF_RNG.uniform", return_value=1.5) as mock_uniform:
+        assert tx._calculate_jittered_backoff(1) == 1.5
+
+    mock_uniform.assert_called_once_with(1, 4)
+
+
 # Resolve config
 def test_execution_config_inherits_from_client(mock_client):
     """Test that resolve_execution_config inherits config from client if not set."""
@@ -836,11 +1080,11 @@ def test_executable_overrides_client_config(mock_client):
     assert tx._max_attempts == 3
 
 
-def test_no_healthy_nodes_raises(mock_client):
+def test_no_healthy_nodes_raises(mock_client, shared_pubkey):
     """Test that execution fails if no healthy nodes are available."""
     mock_client.network._healthy_nodes = []
 
-    tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+    tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
     with pytest.raises(RuntimeError, match="No healthy nodes available"):
         tx.execute(mock_client)
@@ -874,11 +1118,9 @@ def test_set_timeout_overrides_parameter_timeout(mock_client):
 
 
 # Reuest timeout
-def test_request_timeout_exceeded_stops_execution():
+def test_request_timeout_exceeded_stops_execution(mock_cluster, shared_pubkey):
     """Test that execution stops when request_timeout is exceeded."""
-    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
-
-    response_sequences = [[busy_response]]
+    response_sequences = [[_BUSY]]
 
     def fake_time():
         yield 0  # start
@@ -889,31 +1131,60 @@ def test_request_timeout_exceeded_stops_execution():
     time_iter = fake_time()
 
     with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep"),
+        mock_cluster.serve(response_sequences, max_attempts=5) as client,
         patch("hiero_sdk_python.executable.time.monotonic", side_effect=lambda: next(time_iter)),
         patch("hiero_sdk_python.node._Node.is_healthy", return_value=True),
         patch(
             "hiero_sdk_python.executable._execute_method",
-            return_value=busy_response,
+            return_value=_BUSY,
         ),
     ):
         client._request_timeout = 10
-        client.max_attempts = 5
 
-        tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+        tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
         with pytest.raises(MaxAttemptsError):
             tx.execute(client)
 
 
+@pytest.mark.parametrize(
+    "grpc_deadline, request_timeout, expected_timeout",
+    [
+        (2, 10, 2),  # grpc_deadline fits within the remaining request timeout
+        (10, 4, 4),  # the attempt is cut to what is left of the request timeout
+    ],
+)
+def test_grpc_call_timeout_is_bounded_by_remaining_request_timeout(
+    mock_cluster, grpc_deadline, request_timeout, expected_timeout, shared_pubkey
+):
+    """Each gRPC call uses grpc_deadline, capped by the time left in the request timeout."""
+    with (
+        mock_cluster.serve([[]]) as client,
+        patch("hiero_sdk_python.executable.time.monotonic", return_value=0),
+        patch("hiero_sdk_python.node._Node.is_healthy", return_value=True),
+        patch("hiero_sdk_python.executable._execute_method", return_value=_OK) as mock_execute_method,
+        pytest.warns(UserWarning) if grpc_deadline > request_timeout else nullcontext(),
+    ):
+        tx = (
+            AccountCreateTransaction()
+            .set_key_without_alias(shared_pubkey)
+            .set_initial_balance(1)
+            .set_grpc_deadline(grpc_deadline)
+            .set_request_timeout(request_timeout)
+        )
+
+        tx.execute(client, wait_for_receipt=False)
+
+        assert mock_execute_method.call_args[0][2] == expected_timeout
+
+
 @pytest.mark.parametrize(
     "error",
     [
-        RealRpcError(grpc.StatusCode.DEADLINE_EXCEEDED, "timeout"),
-        RealRpcError(grpc.StatusCode.UNAVAILABLE, "unavailable"),
-        RealRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED, "busy"),
-        RealRpcError(grpc.StatusCode.INTERNAL, "received rst stream"),  # internal with rst stream
+        _rpc_err(grpc.StatusCode.DEADLINE_EXCEEDED, "timeout"),
+        _rpc_err(grpc.StatusCode.UNAVAILABLE, "unavailable"),
+        _rpc_err(grpc.StatusCode.RESOURCE_EXHAUSTED, "busy"),
+        _rpc_err(grpc.StatusCode.INTERNAL, "received rst stream"),  # internal with rst stream
         Exception("non grpc exception"),  # non grpc exception
     ],
 )
@@ -926,8 +1197,8 @@ def test_should_exponential_returns_true(error):
 @pytest.mark.parametrize(
     "error",
     [
-        RealRpcError(grpc.StatusCode.INVALID_ARGUMENT, "invalid args"),
-        RealRpcError(grpc.StatusCode.INTERNAL, "internal"),  # internal with no rst stream
+        _rpc_err(grpc.StatusCode.INVALID_ARGUMENT, "invalid args"),
+        _rpc_err(grpc.StatusCode.INTERNAL, "internal"),  # internal with no rst stream
     ],
 )
 def test_should_exponential_returns_false(error):
@@ -939,72 +1210,48 @@ def test_should_exponential_returns_false(error):
 @pytest.mark.parametrize(
     "error",
     [
-        RealRpcError(grpc.StatusCode.DEADLINE_EXCEEDED, "timeout"),
-        RealRpcError(grpc.StatusCode.UNAVAILABLE, "unavailable"),
-        RealRpcError(grpc.StatusCode.RESOURCE_EXHAUSTED, "busy"),
+        _rpc_err(grpc.StatusCode.DEADLINE_EXCEEDED, "timeout"),
+        _rpc_err(grpc.StatusCode.UNAVAILABLE, "unavailable"),
+        _rpc_err(grpc.StatusCode.RESOURCE_EXHAUSTED, "busy"),
     ],
 )
-def test_should_exponential_error_mark_node_unhealty_and_advance(error):
+def test_should_exponential_error_mark_node_unhealty_and_advance(mock_cluster, error, retry_delays, shared_pubkey):
     """Exponential gRPC retry errors advance the node without sleep-based backoff."""
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
-
     response_sequences = [
         [error],
-        [ok_response, receipt_response],
+        [_OK, _SUCCESS_RECEIPT],
     ]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep") as mock_sleep,
-    ):
-        tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+    with mock_cluster.serve(response_sequences) as client:
+        tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
         receipt = tx.execute(client)
 
-        assert receipt.status == ResponseCode.SUCCESS
+        _assert_success(receipt)
         # No delay_for_attempt backoff call, Node is mark unhealthy and advance
-        assert mock_sleep.call_count == 0
+        assert len(retry_delays) == 0
         # Node must have changed
         assert tx._node_account_ids_index == 1
 
 
-def test_rst_stream_error_marks_node_unhealthy_and_advances_without_backoff():
+def test_rst_stream_error_marks_node_unhealthy_and_advances_without_backoff(mock_cluster, retry_delays, shared_pubkey):
     """INTERNAL RST_STREAM errors trigger exponential retry by advancing the node without sleep-based backoff."""
-    error = RealRpcError(grpc.StatusCode.INTERNAL, "received rst stream")
-
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
+    error = _rpc_err(grpc.StatusCode.INTERNAL, "received rst stream")
 
     response_sequences = [
         [error],
-        [ok_response, receipt_response],
+        [_OK, _SUCCESS_RECEIPT],
     ]
 
-    with (
-        mock_hedera_servers(response_sequences) as client,
-        patch("hiero_sdk_python.executable.time.sleep") as mock_sleep,
-    ):
-        tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+    with mock_cluster.serve(response_sequences) as client:
+        tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
         receipt = tx.execute(client)
 
         # Retry succeeds
-        assert receipt.status == ResponseCode.SUCCESS
+        _assert_success(receipt)
         # RST_STREAM exponential retry does not use delay-based backoff
-        assert mock_sleep.call_count == 0
+        assert len(retry_delays) == 0
         # Node must advance after marking the first node unhealthy
         assert tx._node_account_ids_index == 1
 
@@ -1012,60 +1259,50 @@ def test_rst_stream_error_marks_node_unhealthy_and_advances_without_backoff():
 @pytest.mark.parametrize(
     "error",
     [
-        RealRpcError(grpc.StatusCode.ALREADY_EXISTS, "already exists"),
-        RealRpcError(grpc.StatusCode.ABORTED, "aborted"),
-        RealRpcError(grpc.StatusCode.UNAUTHENTICATED, "unauthenticated"),
+        _rpc_err(grpc.StatusCode.ALREADY_EXISTS, "already exists"),
+        _rpc_err(grpc.StatusCode.ABORTED, "aborted"),
+        _rpc_err(grpc.StatusCode.UNAUTHENTICATED, "unauthenticated"),
     ],
 )
-def test_non_exponential_grpc_error_raises_exception(error):
+def test_non_exponential_grpc_error_raises_exception(mock_cluster, error, shared_pubkey):
     """Errors that are not retried exponentially should raise error immediately"""
     response_sequences = [[error]]
 
     with (
-        mock_hedera_servers(response_sequences) as client,
+        mock_cluster.serve(response_sequences) as client,
         pytest.raises(grpc.RpcError),
     ):
-        tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+        tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
         tx.execute(client)
 
 
-def test_execution_skips_unhealthy_nodes_and_advances():
+def test_execution_skips_unhealthy_nodes_and_advances(mock_cluster, shared_pubkey):
     """Execution should skip unhealthy nodes and advance to the next healthy one."""
-    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
-
     response_sequences = [
-        [busy_response],  # first node (unhealthy)
-        [ok_response, receipt_response],  # second node (healthy)
+        [_BUSY],  # first node (unhealthy)
+        [_OK, _SUCCESS_RECEIPT],  # second node (healthy)
     ]
 
     with (
-        mock_hedera_servers(response_sequences) as client,
+        mock_cluster.serve(response_sequences) as client,
         patch(
             "hiero_sdk_python.node._Node.is_healthy",
             side_effect=chain([False, True], repeat(True)),
         ),
     ):
-        tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+        tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
         receipt = tx.execute(client)
 
-        assert receipt.status == ResponseCode.SUCCESS
+        _assert_success(receipt)
         # Ensure the node index advanced past the unhealthy node
         assert tx._node_account_ids_index == 1
 
 
-def test_execution_raises_if_all_nodes_unhealthy(mock_client):
+def test_execution_raises_if_all_nodes_unhealthy(mock_client, shared_pubkey):
     """Execution should raise RuntimeError if all nodes are unhealthy."""
-    tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+    tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
     # Patch node health to always return False
     with (
@@ -1082,46 +1319,50 @@ def test_execution_raises_if_all_nodes_unhealthy(mock_client):
         TransactionGetReceiptQuery().set_transaction_id(TransactionId.from_string("0.0.3@1769674705.770340600")),
     ],
 )
-def test_unhealthy_node_receipt_request_triggers_delay_and_no_node_change(tx, mock_client):
+def test_unhealthy_node_receipt_request_triggers_delay_and_no_node_change(tx, mock_client, retry_delays):
     """Unhealthy node with transaction receipt/record request calls _delay_for_attempt but does not advance node."""
     initial_index = tx._node_account_ids_index
 
-    with (
-        patch("hiero_sdk_python.node._Node.is_healthy", return_value=False),
-        patch("hiero_sdk_python.executable._delay_for_attempt") as mock_delay,
-    ):
+    with patch("hiero_sdk_python.node._Node.is_healthy", return_value=False):
         with pytest.raises(MaxAttemptsError):
             tx.execute(mock_client)
 
         # _delay_for_attempt called
-        assert mock_delay.call_count > 0
+        assert len(retry_delays) > 0
         # Node index did NOT change
         assert tx._node_account_ids_index == initial_index
 
 
-def test_retry_invalid_node_account_updates_network():
+def test_unhealthy_node_backoff_uses_the_execution_request_id(mock_client, retry_delays):
+    """The backoff for an unhealthy node is logged under the request ID of the execution."""
+    query = TransactionGetReceiptQuery().set_transaction_id(TransactionId.from_string("0.0.3@1769674705.770340600"))
+
+    with (
+        patch("hiero_sdk_python.node._Node.is_healthy", return_value=False),
+        patch.object(query, "_get_request_id", return_value="request-1") as mock_request_id,
+        pytest.raises(MaxAttemptsError),
+    ):
+        query.execute(mock_client)
+
+    mock_request_id.assert_called_once()
+    assert retry_delays
+    assert all(args[0] == "request-1" for args in retry_delays)
+
+
+def test_retry_invalid_node_account_updates_network(mock_cluster, retry_delays, shared_pubkey):
     """
     Verify that a RETRY execution state with INVALID_NODE_ACCOUNT triggers
     node backoff, network refresh, and retry delay before succeeding.
     """
-    error_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.INVALID_NODE_ACCOUNT)
-
-    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
-
-    receipt_response = response_pb2.Response(
-        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
-            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
-            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
-        )
-    )
+    error_response = _PRECHECK[ResponseCode.INVALID_NODE_ACCOUNT]
 
     response_sequences = [
         [error_response],  # first node → INVALID_NODE_ACCOUNT
-        [ok_response],  # second node → success
+        [_OK],  # second node → success
     ]
 
     with (
-        mock_hedera_servers(response_sequences) as client,
+        mock_cluster.serve(response_sequences) as client,
         patch("hiero_sdk_python.node._Node.is_healthy", return_value=True),
         patch(
             "hiero_sdk_python.client.network.Network._increase_backoff",
@@ -1129,15 +1370,12 @@ def test_retry_invalid_node_account_updates_network():
         patch(
             "hiero_sdk_python.client.client.Client.update_network",
         ) as mock_update_network,
-        patch(
-            "hiero_sdk_python.executable._delay_for_attempt",
-        ) as mock_delay,
         patch(
             "hiero_sdk_python.transaction.transaction_response.TransactionResponse.get_receipt",
-            return_value=receipt_response,
+            return_value=_SUCCESS_RECEIPT,
         ),
     ):
-        tx = AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+        tx = AccountCreateTransaction().set_key_without_alias(shared_pubkey).set_initial_balance(1)
 
         tx.execute(client)
 
@@ -1147,4 +1385,4 @@ def test_retry_invalid_node_account_updates_network():
         # Recovery actions
         mock_increase_backoff.assert_called_once()
         mock_update_network.assert_called_once()
-        mock_delay.assert_called_once()
+        assert len(retry_delays) == 1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from unittest.mock import patch
 
 import pytest
@@ -73,7 +74,7 @@ def test_receipt_query_retry_on_receipt_not_found(transaction_id):
 
     with (
         mock_hedera_servers(response_sequences) as client,
-        patch("time.sleep") as mock_sleep,
+        patch("hiero_sdk_python.executable._delay_for_attempt") as mock_sleep,
     ):
         query = TransactionGetReceiptQuery().set_transaction_id(transaction_id)
 
@@ -105,18 +106,17 @@ def test_receipt_query_receipt_status_error(transaction_id):
 
     response_sequences = [[error_response]]
 
-    with mock_hedera_servers(response_sequences) as client, patch("time.sleep"):
-        client.max_attempts = 1
+    with (
+        mock_hedera_servers(response_sequences, max_attempts=1) as client,
+        patch("hiero_sdk_python.executable._delay_for_attempt"),
+    ):
         query = TransactionGetReceiptQuery().set_transaction_id(transaction_id)
 
         # Create the query and verify it fails with the expected error
-        with pytest.raises(MaxAttemptsError) as exc_info:
+        expected = f"Receipt for transaction {transaction_id} contained error status: UNKNOWN ({ResponseCode.UNKNOWN})"
+        with pytest.raises(MaxAttemptsError, match=re.escape(expected)):
             query.execute(client)
 
-        assert str(
-            f"Receipt for transaction {transaction_id} contained error status: UNKNOWN ({ResponseCode.UNKNOWN})"
-        ) in str(exc_info.value)
-
 
 def test_receipt_query_does_not_require_payment():
     """Test that the receipt query does not require payment."""
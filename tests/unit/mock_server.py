@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import threading
+from collections import deque
 from concurrent import futures
 from contextlib import contextmanager
 
@@ -33,7 +35,8 @@ class MockServer:
         Args:
             responses (list): List of response objects to return in sequence
         """
-        self.responses = responses
+        # Served first-in first-out, so keep them in a deque for constant-time pops
+        self.responses = deque(responses)
         self._lock = threading.Lock()
         self.server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
 
@@ -97,7 +100,7 @@ class MockServer:
         Returns:
             A mock servicer object
         """
-        responses = self.responses
+        server = self
         lock = self._lock
 
         class MockServicer(servicer_class):
@@ -108,10 +111,11 @@ class MockServer:
 
                 def method_wrapper(_, context):
                     with lock:
+                        responses = server.responses
                         if not responses:
                             return None
 
-                        response = responses.pop(0)
+                        response = responses.popleft()
 
                     if isinstance(response, RealRpcError):
                         # Abort with custom error
@@ -123,6 +127,16 @@ class MockServer:
 
         return MockServicer()
 
+    def set_responses(self, responses):
+        """
+        Replace the responses the server returns, so a running server can be reused.
+
+        Args:
+            responses (list): List of response objects to return in sequence
+        """
+        with self._lock:
+            self.responses = deque(responses)
+
     def close(self):
         """Stop the server."""
         shutdown_event = self.server.stop(0)
@@ -146,26 +160,86 @@ class RealRpcError(grpc.RpcError):
         return self._details
 
 
-@contextmanager
-def mock_hedera_servers(response_sequences):
+@functools.lru_cache(maxsize=32)
+def _rpc_err(status_code, details="Test error"):
     """
-    Context manager that creates mock Hedera servers and a client.
+    Return a shared RealRpcError for the given status code and details.
 
-    Args:
-        response_sequences: List of response sequences, one for each mock server
+    Mock servers only read the code and details when aborting a call, so one
+    instance per (status_code, details) can be served by any number of tests.
+    """
+    return RealRpcError(status_code, details)
 
-    Yields:
-        Client: The configured client
+
+class MockCluster:
     """
-    # Create mock servers
-    servers = [MockServer(responses) for responses in response_sequences]
+    Mock Hedera servers that stay up while the client and responses change.
+
+    Starting gRPC servers dominates the cost of the mock tests, so a cluster can be
+    started once and reused by many tests, each installing its own response sequences
+    and getting a fresh client for them.
+    """
+
+    def __init__(self, size=3):
+        """
+        Initialize a cluster of mock servers.
+
+        Args:
+            size (int): Number of servers to start; more are added if a test needs them
+        """
+        self.size = size
+        self.servers = []
+        self.client = None
+        self._node_count = 0
+        self._operator_key = PrivateKey.generate()
+
+    def start(self):
+        """Start the mock servers."""
+        self.servers = [MockServer([]) for _ in range(self.size)]
+        return self
+
+    def stop(self):
+        """Close the current client and stop the mock servers."""
+        self._close_client()
+        for server in self.servers:
+            server.close()
+        self.servers = []
+
+    def set_response_sequences(self, response_sequences):
+        """
+        Install the responses each server returns, one sequence per node.
+
+        Servers without a sequence are cleared, and the next client only includes
+        the nodes that were given one.
+
+        Args:
+            response_sequences: List of response sequences, one for each mock server
+        """
+        for _ in range(len(self.servers), len(response_sequences)):
+            self.servers.append(MockServer([]))
+
+        for i, server in enumerate(self.servers):
+            server.set_responses(response_sequences[i] if i < len(response_sequences) else [])
+
+        self._node_count = len(response_sequences)
+
+    def reset_client(self, max_attempts=4):
+        """
+        Replace the current client with a fresh one for the active servers.
+
+        Args:
+            max_attempts (int): Maximum number of attempts the client makes per request
+
+        Returns:
+            Client: The configured client
+        """
+        self._close_client()
 
-    try:
         # Configure the network with mock servers
-        nodes = []
-        for i, server in enumerate(servers):
-            node = _Node(AccountId(0, 0, 3 + i), server.address, None)
-            nodes.append(node)
+        nodes = [
+            _Node(AccountId(0, 0, 3 + i), server.address, None)
+            for i, server in enumerate(self.servers[: self._node_count])
+        ]
 
         # Create network and client
         network = Network(nodes=nodes)
@@ -183,12 +257,55 @@ def mock_hedera_servers(response_sequences):
 
         client.logger.set_level(LogLevel.DISABLED)
         # Set the operator
-        key = PrivateKey.generate()
-        client.set_operator(AccountId(0, 0, 1800), key)
-        client.max_attempts = 4  # Configure for testing
+        client.set_operator(AccountId(0, 0, 1800), self._operator_key)
+        client.max_attempts = max_attempts
+
+        self.client = client
+        return client
+
+    @contextmanager
+    def serve(self, response_sequences, max_attempts=4):
+        """
+        Context manager that serves the given responses to a fresh client.
+
+        Args:
+            response_sequences: List of response sequences, one for each mock server
+            max_attempts (int): Maximum number of attempts the client makes per request
+
+        Yields:
+            Client: The configured client
+        """
+        self.set_response_sequences(response_sequences)
+        try:
+            yield self.reset_client(max_attempts)
+        finally:
+            # Leftover responses must not leak into the next test
+            self._close_client()
+            self.set_response_sequences([])
 
-        yield client
+    def _close_client(self):
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+
+@contextmanager
+def mock_hedera_servers(response_sequences, max_attempts=4):
+    """
+    Context manager that creates mock Hedera servers and a client.
+
+    Args:
+        response_sequences: List of response sequences, one for each mock server
+        max_attempts (int): Maximum number of attempts the client makes per request
+
+    Yields:
+        Client: The configured client
+    """
+    cluster = MockCluster(size=len(response_sequences)).start()
+
+    try:
+        with cluster.serve(response_sequences, max_attempts) as client:
+            yield client
     finally:
         # Clean up the servers
-        for server in servers:
-            server.close()
+        cluster.stop()
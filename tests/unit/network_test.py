@@ -281,6 +281,9 @@ def test_set_network_nodes_with_explicit_nodes():
     node1 = Mock(spec=_Node)
     node2 = Mock(spec=_Node)
 
+    node1._account_id = AccountId(0, 0, 3)
+    node2._account_id = AccountId(0, 0, 4)
+
     node1.is_healthy.return_value = True
     node2.is_healthy.return_value = False
 
@@ -288,6 +291,7 @@ def test_set_network_nodes_with_explicit_nodes():
 
     assert network.nodes == [node1, node2]
     assert network._healthy_nodes == [node1]
+    assert network._get_node(AccountId(0, 0, 4)) is node2
 
 
 def test_set_network_nodes_resets_healthy_nodes():
@@ -300,6 +304,7 @@ def test_set_network_nodes_resets_healthy_nodes():
     network._healthy_nodes = [old_node]
 
     new_node = Mock(spec=_Node)
+    new_node._account_id = AccountId(0, 0, 3)
     new_node.is_healthy.return_value = True
 
     network._set_network_nodes([new_node])
@@ -365,6 +370,54 @@ def test_get_node_returns_none_when_not_found():
     assert network._get_node("0.0.999") is None
 
 
+def test_get_node_follows_replaced_node_list():
+    """
+    Test _get_node reindexes the nodes when the node list is replaced.
+    """
+    network = Network("testnet")
+
+    node1 = _Node(AccountId(0, 0, 3), "127.0.0.1:8080", None)
+    node2 = _Node(AccountId(0, 0, 4), "127.0.0.1:8081", None)
+
+    network.nodes = [node1]
+    assert network._get_node(AccountId(0, 0, 3)) is node1
+    assert network._get_node(AccountId(0, 0, 4)) is None
+
+    network.nodes = [node2]
+    assert network._get_node(AccountId(0, 0, 3)) is None
+    assert network._get_node(AccountId(0, 0, 4)) is node2
+
+
+def test_get_node_returns_first_node_for_duplicate_account_id():
+    """
+    Test _get_node keeps returning the first node when account IDs repeat.
+    """
+    network = Network("testnet")
+
+    first = _Node(AccountId(0, 0, 3), "127.0.0.1:8080", None)
+    second = _Node(AccountId(0, 0, 3), "127.0.0.1:8081", None)
+    network.nodes = [first, second]
+
+    assert network._get_node(AccountId(0, 0, 3)) is first
+
+
+def test_get_node_indexes_duplicate_account_ids_once():
+    """
+    Test _get_node does not rebuild the index on every lookup when account IDs repeat.
+    """
+    network = Network("testnet")
+
+    first = _Node(AccountId(0, 0, 3), "127.0.0.1:8080", None)
+    second = _Node(AccountId(0, 0, 3), "127.0.0.1:8081", None)
+    network.nodes = [first, second]
+
+    with patch.object(network, "_index_nodes", wraps=network._index_nodes) as index_nodes:
+        for _ in range(3):
+            assert network._get_node(AccountId(0, 0, 3)) is first
+
+    index_nodes.assert_called_once()
+
+
 # Tests parse_mirror_address
 @pytest.mark.parametrize(
     "mirror_addr,expected_host,expected_port",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import pytest
 
@@ -82,3 +84,22 @@ def test_decrease_backoff_floors_at_min(node):
 
     node._decrease_backoff()
     assert node._current_backoff == node._min_backoff
+
+
+def test_get_channel_creates_one_channel_across_threads(node):
+    """Test that concurrent _get_channel calls on one node share a single channel."""
+
+    def slow_insecure_channel(address):
+        # Widen the window between the channel check and its assignment
+        time.sleep(0.05)
+        return object()
+
+    with (
+        patch("grpc.insecure_channel", side_effect=slow_insecure_channel) as insecure_channel,
+        patch("grpc.intercept_channel", side_effect=lambda channel, *interceptors: channel),
+        ThreadPoolExecutor(max_workers=8) as pool,
+    ):
+        channels = list(pool.map(lambda _: node._get_channel(), range(8)))
+
+    insecure_channel.assert_called_once()
+    assert all(channel is channels[0] for channel in channels)
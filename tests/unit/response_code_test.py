@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.response_code import ResponseCode
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("code", [ResponseCode.OK, ResponseCode.BUSY, ResponseCode.INVALID_SIGNATURE])
+def test_get_name_returns_member_name(code):
+    """Test that get_name returns the name of a known response code."""
+    with pytest.warns(FutureWarning):
+        assert ResponseCode.get_name(int(code)) == code.name
+
+
+def test_get_name_for_unknown_code():
+    """Test that get_name falls back to the UNKNOWN_CODE_<value> name for unknown codes."""
+    with pytest.warns(FutureWarning):
+        assert ResponseCode.get_name(999_999) == "UNKNOWN_CODE_999999"
+
+
+def test_unknown_code_is_flagged():
+    """Test that an unknown response code is reported as unknown."""
+    assert ResponseCode(999_999).is_unknown
+    assert not ResponseCode.OK.is_unknown
@@ -8,6 +8,7 @@ from hiero_sdk_python.hapi.services import timestamp_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
     SchedulableTransactionBody,
 )
+from hiero_sdk_python.tokens.token_id import TokenId
 from hiero_sdk_python.tokens.token_unfreeze_transaction import TokenUnfreezeTransaction
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 
@@ -68,6 +69,26 @@ def test_missing_account_id(mock_account_ids):
         unfreeze_tx.build_transaction_body()
 
 
+def test_set_methods_require_not_frozen(mock_account_ids, mock_client):
+    """Test the set methods of TokenUnfreezeTransaction when the transaction is frozen."""
+    account_id, freeze_id, _, token_id, _ = mock_account_ids
+
+    unfreeze_tx = TokenUnfreezeTransaction(account_id=freeze_id, token_id=token_id)
+    unfreeze_tx.freeze_with(mock_client)
+    body_bytes = dict(unfreeze_tx._transaction_body_bytes)
+
+    with pytest.raises(Exception, match="Transaction is immutable; it has been frozen"):
+        unfreeze_tx.set_token_id(TokenId(0, 0, 999))
+
+    with pytest.raises(Exception, match="Transaction is immutable; it has been frozen"):
+        unfreeze_tx.set_account_id(account_id)
+
+    # The rejected setters left the frozen transaction untouched
+    assert unfreeze_tx.token_id == token_id
+    assert unfreeze_tx.account_id == freeze_id
+    assert unfreeze_tx._transaction_body_bytes == body_bytes
+
+
 def test_sign_transaction(mock_account_ids, mock_client):
     """Test signing the token unfreeze transaction with a freeze key."""
     account_id, freeze_id, _, token_id, _ = mock_account_ids
@@ -359,3 +359,35 @@ def test_topic_update_transaction_with_all_fields(topic_id):
 
         # Verify the receipt contains the expected values
         assert receipt.status == ResponseCode.SUCCESS
+
+
+def test_topic_update_body_leaves_unset_fields_absent(topic_id):
+    """Test that only the fields being updated are present in the protobuf body."""
+    body = TopicUpdateTransaction(topic_id=topic_id, auto_renew_period=None)._build_proto_body()
+
+    assert body.HasField("topicID")
+    for field in (
+        "adminKey",
+        "submitKey",
+        "autoRenewPeriod",
+        "autoRenewAccount",
+        "expirationTime",
+        "custom_fees",
+        "fee_schedule_key",
+        "fee_exempt_key_list",
+    ):
+        assert not body.HasField(field)
+
+
+def test_topic_update_body_keeps_cleared_fields_present(topic_id):
+    """Test that clearing the memo, custom fees and fee exempt keys still sends the empty values."""
+    tx = TopicUpdateTransaction(topic_id=topic_id).set_memo("").clear_custom_fees().clear_fee_exempt_keys()
+
+    body = tx._build_proto_body()
+
+    assert body.HasField("memo")
+    assert body.memo.value == ""
+    assert body.HasField("custom_fees")
+    assert len(body.custom_fees.fees) == 0
+    assert body.HasField("fee_exempt_key_list")
+    assert len(body.fee_exempt_key_list.keys) == 0
@@ -8,6 +8,8 @@ and expected behavior.
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
@@ -685,3 +687,23 @@ def test_map_response_raises_if_proto_request_is_not_transaction():
             node_id=mock_node_id,
             proto_request=invalid_proto_request,
         )
+
+
+def test_freeze_builds_body_once_for_multiple_nodes():
+    """Test that freezing for several nodes builds the body once and only swaps the node account ID."""
+    node_ids = [AccountId.from_string("0.0.3"), AccountId.from_string("0.0.4"), AccountId.from_string("0.0.5")]
+
+    transaction = TransferTransaction().add_hbar_transfer(AccountId.from_string("0.0.1234"), -1)
+    transaction.add_hbar_transfer(AccountId.from_string("0.0.5678"), 1)
+    transaction.transaction_id = TransactionId.generate(AccountId.from_string("0.0.1234"))
+    transaction.set_node_account_ids(node_ids)
+
+    with patch.object(transaction, "build_transaction_body", wraps=transaction.build_transaction_body) as mock_build:
+        transaction.freeze()
+
+    assert mock_build.call_count == 1
+
+    for node_id in node_ids:
+        transaction.node_account_id = node_id
+        expected = transaction.build_transaction_body().SerializeToString()
+        assert transaction._transaction_body_bytes[node_id] == expected